@@ -139,7 +139,10 @@ class VendorViewSet(viewsets.ModelViewSet):
             serializer.is_valid(raise_exception=True)
 
             # Create vendor using service
-            vendor = self._service.create_vendor(serializer.validated_data)
+            vendor = self._service.create_vendor(
+                serializer.validated_data,
+                actor=request.user.pk
+            )
 
             # Log successful creation
             self._audit_logger.log_change(
@@ -68,6 +68,7 @@ app.conf.task_queues = {
 app.conf.task_routes = {
     'requests.tasks.*': {'queue': 'ai_processing'},
     'proposals.tasks.*': {'queue': 'proposals'},
+    'users.tasks.*': {'queue': 'notifications'},
     'notifications.*': {'queue': 'notifications'}
 }
 
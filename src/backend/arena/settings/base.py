@@ -63,13 +63,16 @@ MIDDLEWARE = [
     'core.middleware.logging.LoggingMiddleware',
     'core.middleware.timing.TimingMiddleware',
     'core.middleware.security.SecurityHeadersMiddleware',
+    'users.middleware.RoleBasedAccessMiddleware',
 ]
 
 # Authentication configuration
 AUTH_USER_MODEL = 'users.User'
 
 AUTHENTICATION_BACKENDS = [
-    'django.contrib.auth.backends.ModelBackend',
+    'users.auth.MagicLinkBackend',  # Magic link authentication
+    'users.auth.GoogleOAuthBackend',  # Google OAuth
+    'django.contrib.auth.backends.ModelBackend',  # Default backend
 ]
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -91,9 +94,121 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 # Session security settings
-SESSION_COOKIE_AGE = 43200  # 12 hours
+SESSION_COOKIE_AGE = 86400  # 24 hours
 SESSION_COOKIE_SECURE = True
-SESSION_COOKIE_SAMESITE = 'Strict'
+SESSION_COOKIE_HTTPONLY = True
+SESSION_COOKIE_SAMESITE = 'Lax'
+SESSION_EXPIRE_AT_BROWSER_CLOSE = True
+
+# User data encryption settings
+USER_FIELD_ENCRYPTION_KEY = environ.get('USER_FIELD_ENCRYPTION_KEY')
+ENCRYPTED_USER_FIELDS = [
+    'full_name',
+    'company',
+]
+
+# User activity logging
+USER_ACTIVITY_LOGGER = 'users.logging.UserActivityLogger'
+LOG_USER_EVENTS = [
+    'login',
+    'logout',
+    'password_change',
+    'role_change',
+    'security_event',
+]
+
+# Magic link settings
+MAGIC_LINK_EXPIRY = 900  # 15 minutes
+MAGIC_LINK_MAX_RETRIES = 3
+MAGIC_LINK_COOLDOWN = 3600  # 1 hour
+# BLAKE2b key for token cache keys, max 64 bytes; derived from SECRET_KEY when empty
+TOKEN_HASH_KEY = environ.get('TOKEN_HASH_KEY', '')
+
+# Google OAuth settings
+GOOGLE_OAUTH_SCOPES = [
+    'email',
+    'profile',
+    'https://www.googleapis.com/auth/userinfo.email',
+    'https://www.googleapis.com/auth/userinfo.profile',
+]
+GOOGLE_OAUTH_WORKSPACE_ONLY = True
+
+# User data classification
+USER_DATA_CLASSIFICATION = DataClassification.HIGHLY_SENSITIVE.value
+USER_DATA_RETENTION_DAYS = 30  # After account deletion
+
+# Vendor security controls
+VENDOR_DATA_CLASSIFICATION = DataClassification.SENSITIVE.value
+VENDOR_ENCRYPTION = {
+    'algorithm': 'AES-256-GCM',
+    'key_rotation_days': 90,
+    'backup_retention_days': 30
+}
+VENDOR_ACCESS_CONTROLS = {
+    'require_mfa': True,
+    'session_timeout_minutes': 30,
+    'max_failed_attempts': 5
+}
+
+# Vendor field-level encryption
+VENDOR_ENCRYPTED_FIELDS = [
+    'tax_id',
+    'bank_details',
+    'api_credentials',
+    'contact_details'
+]
+FIELD_ENCRYPTION = {
+    'key_provider': 'django_encryption.providers.aws.KMSProvider',
+    'auto_rotate_keys': True,
+    'rotation_period_days': 90
+}
+
+# Vendor audit logging
+VENDOR_AUDIT_CONFIG = {
+    'log_all_access': True,
+    'log_changes': True,
+    'log_exports': True,
+    'retention_period_days': 365
+}
+AUDIT_HANDLERS = [
+    'vendors.audit.DatabaseAuditHandler',
+    'vendors.audit.CloudWatchHandler'
+]
+
+# Vendor data retention
+VENDOR_RETENTION = {
+    'active_period_days': 730,  # 2 years
+    'archive_period_days': 2555,  # 7 years
+    'backup_retention_days': 90
+}
+DATA_CLEANUP_JOBS = [
+    'vendors.cleanup.ArchiveInactiveVendors',
+    'vendors.cleanup.PurgeExpiredData'
+]
+
+# Vendor data masking
+VENDOR_MASKING_RULES = {
+    'email': 'partial',
+    'phone': 'last_4_digits',
+    'tax_id': 'full_mask',
+    'bank_details': 'full_mask'
+}
+MASKING_HANDLERS = [
+    'vendors.masking.PIIMaskingHandler',
+    'vendors.masking.ExportMaskingHandler'
+]
+
+# Vendor monitoring
+VENDOR_MONITORING = {
+    'track_access_patterns': True,
+    'alert_on_suspicious': True,
+    'rate_limit_threshold': 100,
+    'alert_channels': ['email', 'slack']
+}
+MONITORING_HANDLERS = [
+    'vendors.monitoring.AccessMonitor',
+    'vendors.monitoring.SecurityAlertHandler'
+]
 
 # REST Framework configuration
 REST_FRAMEWORK = {
@@ -191,12 +306,12 @@ CACHES = {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
             'SOCKET_CONNECT_TIMEOUT': 5,
             'SOCKET_TIMEOUT': 5,
-            'RETRY_ON_TIMEOUT': True,
-            'MAX_CONNECTIONS': 1000,
             'CONNECTION_POOL_CLASS': 'redis.connection.BlockingConnectionPool',
-            'CONNECTION_POOL_CLASS_KWARGS': {
-                'max_connections': 50,
+            'CONNECTION_POOL_KWARGS': {
+                'max_connections': 100,
                 'timeout': 20,
+                'retry_on_timeout': True,
+                'socket_keepalive': True,
             }
         }
     }
@@ -0,0 +1,56 @@
+"""
+Test environment specific Django settings for Arena MVP platform.
+
+This module configures fast, isolated settings for the test suite including:
+- PostgreSQL test database reused between runs
+- Local memory cache
+- Fast password hashing
+- In-memory email backend
+- Logging left unconfigured
+
+Version: 1.0.0
+"""
+
+from os import environ  # Python 3.11+
+from arena.settings.base import *  # Import all base settings
+
+# Debug configuration
+DEBUG = False
+ALLOWED_HOSTS = ['testserver', 'localhost']
+SECRET_KEY = 'django-insecure-test-only-key-do-not-use-in-production'
+
+# Database configuration - PostgreSQL, as vendor matching relies on jsonb
+# containment lookups and GIN indexes
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': environ.get('TEST_DB_NAME', 'arena_test'),
+        'USER': environ.get('TEST_DB_USER', 'postgres'),
+        'PASSWORD': environ.get('TEST_DB_PASSWORD', 'postgres'),
+        'HOST': environ.get('TEST_DB_HOST', 'localhost'),
+        'PORT': environ.get('TEST_DB_PORT', '5432'),
+    }
+}
+
+# Cache configuration
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Password hashing - MD5 is insecure but fast enough for tests
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Logging - skip the console, correlation and admin-mail handlers from base;
+# records still reach pytest's capture via the root logger
+LOGGING_CONFIG = None
+
+# Email configuration
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+ALLOWED_EMAIL_DOMAINS = ['company.com', 'enterprise.com', 'business.com', 'corp.com']
+
+# Token hashing
+TOKEN_HASH_KEY = 'test-token-hash-key'
@@ -36,6 +36,7 @@ ERROR_CODE_RANGES = {
         "INVALID_FORMAT": "E2001",
         "MISSING_FIELDS": "E2002",
         "UPLOAD_FAILED": "E2003",
+        "RATE_LIMITED": "E2004",
         "RANGE": "E2001-E2999"
     },
     "PROPOSAL": {
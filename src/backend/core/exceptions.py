@@ -208,11 +208,24 @@ class SystemError(BaseArenaException):
     ) -> None:
         super().__init__(message, code, status_code, details)
 
+class EmailError(BaseArenaException):
+    """Exception class for email delivery errors."""
+    
+    def __init__(
+        self,
+        message: str = "Email delivery failed",
+        code: str = ERROR_CODE_RANGES["SYSTEM"]["SERVICE_UNAVAILABLE"],
+        details: Optional[Dict[str, Any]] = None,
+        status_code: int = HTTPStatus.SERVICE_UNAVAILABLE
+    ) -> None:
+        super().__init__(message, code, status_code, details)
+
 # Export all exception classes
 __all__ = [
     'BaseArenaException',
     'AuthenticationError',
     'RequestError',
     'ProposalError',
-    'SystemError'
+    'SystemError',
+    'EmailError'
 ]
\ No newline at end of file
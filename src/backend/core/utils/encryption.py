@@ -13,7 +13,7 @@ import os
 import re
 import json
 import logging
-from typing import Dict, Union, Optional, Pattern, Type, TracebackType
+from typing import Dict, List, Union, Optional, Pattern, Type, TracebackType
 from base64 import b64encode, b64decode
 
 # Third-party imports
@@ -88,6 +88,57 @@ class EncryptionContext:
         finally:
             self._kms_client = None
 
+def _to_bytes(data: Union[str, bytes, dict]) -> bytes:
+    """Convert supported plaintext types to bytes."""
+    if isinstance(data, dict):
+        return json.dumps(data).encode()
+    if isinstance(data, str):
+        return data.encode()
+    return data
+
+def _generate_data_key() -> Dict[str, bytes]:
+    """Request a fresh AES-256 data key from KMS."""
+    kms_client = boto3.client('kms')
+    return kms_client.generate_data_key(
+        KeyId=KMS_KEY_ID,
+        KeySpec='AES_256'
+    )
+
+def _decrypt_data_key(encrypted_key: bytes) -> bytes:
+    """Recover the plaintext data key for a KMS-encrypted key blob."""
+    kms_client = boto3.client('kms')
+    return kms_client.decrypt(
+        CiphertextBlob=encrypted_key,
+        KeyId=KMS_KEY_ID
+    )['Plaintext']
+
+def _seal(aesgcm: AESGCM, encrypted_key: bytes, data: bytes) -> str:
+    """
+    Encrypt a single value with a prepared cipher and a fresh 96-bit IV.
+
+    Args:
+        aesgcm: Cipher initialized with the plaintext data key
+        encrypted_key: KMS-encrypted copy of the data key
+        data: Plaintext bytes
+
+    Returns:
+        Base64 encoded encrypted data with IV and authentication tag
+    """
+    iv = os.urandom(12)  # 96 bits for GCM
+    ciphertext = aesgcm.encrypt(iv, data, None)
+
+    # Combine components
+    encrypted_data = {
+        'version': VERSION_IDENTIFIER,
+        'key': b64encode(encrypted_key).decode(),
+        'iv': b64encode(iv).decode(),
+        'data': b64encode(ciphertext[:-16]).decode(),
+        'tag': b64encode(ciphertext[-16:]).decode()
+    }
+
+    # Encode final result
+    return b64encode(json.dumps(encrypted_data).encode()).decode()
+
 def encrypt_data(data: Union[str, bytes, dict], classification: DataClassification) -> str:
     """
     Encrypts data using AES-256-GCM with keys from AWS KMS.
@@ -102,51 +153,52 @@ def encrypt_data(data: Union[str, bytes, dict], classification: DataClassificati
     Raises:
         EncryptionError: If encryption fails
     """
+    return encrypt_many([data], classification)[0]
+
+def encrypt_many(
+    values: List[Union[str, bytes, dict]],
+    classification: DataClassification
+) -> List[str]:
+    """
+    Encrypts several values with a single KMS data key and cipher instance.
+
+    Each value gets its own random IV, and the output format matches
+    encrypt_data so values can be decrypted individually with decrypt_data.
+
+    Args:
+        values: Data items to encrypt (strings, bytes, or dictionaries)
+        classification: Data classification level
+
+    Returns:
+        List of base64 encoded encrypted values in input order
+
+    Raises:
+        EncryptionError: If encryption fails
+    """
+    if not values:
+        return []
+
     try:
-        # Convert input to bytes
-        if isinstance(data, dict):
-            data = json.dumps(data).encode()
-        elif isinstance(data, str):
-            data = data.encode()
-        
-        # Generate random IV
-        iv = os.urandom(12)  # 96 bits for GCM
-        
-        # Get encryption key from KMS
-        kms_client = boto3.client('kms')
-        key_response = kms_client.generate_data_key(
-            KeyId=KMS_KEY_ID,
-            KeySpec='AES_256'
-        )
+        # Get encryption key from KMS once for the whole batch
+        key_response = _generate_data_key()
         data_key = key_response['Plaintext']
         encrypted_key = key_response['CiphertextBlob']
-        
-        # Create cipher and encrypt
+
+        # Create cipher once and encrypt each value
         aesgcm = AESGCM(data_key)
-        ciphertext = aesgcm.encrypt(iv, data, None)
-        
-        # Combine components
-        encrypted_data = {
-            'version': VERSION_IDENTIFIER,
-            'key': b64encode(encrypted_key).decode(),
-            'iv': b64encode(iv).decode(),
-            'data': b64encode(ciphertext[:-16]).decode(),
-            'tag': b64encode(ciphertext[-16:]).decode()
-        }
-        
-        # Encode final result
-        result = b64encode(json.dumps(encrypted_data).encode()).decode()
-        
+        results = [_seal(aesgcm, encrypted_key, _to_bytes(value)) for value in values]
+
         logger.info(
             f"Data encrypted successfully",
             extra={
                 'classification': classification.value,
-                'version': VERSION_IDENTIFIER
+                'version': VERSION_IDENTIFIER,
+                'count': len(results)
             }
         )
-        
-        return result
-        
+
+        return results
+
     except Exception as e:
         logger.error(f"Encryption error: {str(e)}")
         raise EncryptionError("Failed to encrypt data", {'error': str(e)})
@@ -183,12 +235,7 @@ def decrypt_data(encrypted_data: str) -> Union[str, bytes, dict]:
         tag = b64decode(encrypted_dict['tag'])
         
         # Get decryption key from KMS
-        kms_client = boto3.client('kms')
-        key_response = kms_client.decrypt(
-            CiphertextBlob=encrypted_key,
-            KeyId=KMS_KEY_ID
-        )
-        data_key = key_response['Plaintext']
+        data_key = _decrypt_data_key(encrypted_key)
         
         # Decrypt data
         aesgcm = AESGCM(data_key)
@@ -276,6 +323,7 @@ def rotate_encryption_key() -> bool:
 # Export public interface
 __all__ = [
     'encrypt_data',
+    'encrypt_many',
     'decrypt_data',
     'mask_pii',
     'rotate_encryption_key',
@@ -36,6 +36,14 @@ ALLOWED_FILE_TYPES = [
 ]
 MAX_FILE_SIZE_BYTES = 10_485_760  # 10MB
 
+# Consumer email providers rejected for business accounts
+PERSONAL_EMAIL_DOMAINS = frozenset({
+    'gmail.com',
+    'yahoo.com',
+    'hotmail.com',
+    'outlook.com'
+})
+
 # XSS prevention patterns
 XSS_PATTERNS = [
     r'<script.*?>.*?</script>',
@@ -73,7 +81,7 @@ def validate_email(email: str) -> bool:
 
     # Business domain validation
     domain = email.split('@')[1].lower()
-    if domain in ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']:
+    if domain in PERSONAL_EMAIL_DOMAINS:
         raise ValidationError("Please use a business email address", code="E2001")
 
     return True
@@ -12,6 +12,7 @@ Version: 1.0.0
 
 import re
 import time
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 import boto3  # version: 1.26+
@@ -26,12 +27,19 @@ AWS_REGION = settings.AWS_REGION
 AWS_ACCESS_KEY_ID = settings.AWS_ACCESS_KEY_ID
 AWS_SECRET_ACCESS_KEY = settings.AWS_SECRET_ACCESS_KEY
 EMAIL_RATE_LIMIT = settings.EMAIL_RATE_LIMIT
-ALLOWED_EMAIL_DOMAINS = settings.ALLOWED_EMAIL_DOMAINS
+ALLOWED_EMAIL_DOMAINS = frozenset(domain.lower() for domain in settings.ALLOWED_EMAIL_DOMAINS)
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_BACKOFF = 2
 
+@lru_cache(maxsize=4096)
+def is_allowed_domain(domain: str) -> bool:
+    """Check an email domain against the allowed set, memoized per domain."""
+    return domain.lower() in ALLOWED_EMAIL_DOMAINS
+
+
 class SESClient:
     """Enhanced AWS SES client with security features for magic links and system notifications."""
     
@@ -265,13 +273,11 @@ class SESClient:
             bool: True if email is valid and verified
         """
         # Basic format validation
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email_address):
+        if not EMAIL_PATTERN.match(email_address):
             return False
 
         # Domain validation
-        domain = email_address.split('@')[1]
-        if domain not in ALLOWED_EMAIL_DOMAINS:
+        if not is_allowed_domain(email_address.split('@')[1]):
             return False
 
         # SES verification check if required
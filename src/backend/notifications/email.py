@@ -3,6 +3,7 @@ Email service module for Arena MVP platform.
 
 Provides secure and reliable email notifications with:
 - Magic link authentication
+- Login notifications
 - Proposal notifications 
 - Request confirmations
 - Enhanced security and monitoring
@@ -29,6 +30,7 @@ logger = logging.getLogger(__name__)
 # Email template paths
 EMAIL_TEMPLATES = {
     'magic_link': 'email/magic_link.html',
+    'login_notification': 'email/login_notification.html',
     'proposal_received': 'email/proposal_received.html',
     'request_created': 'email/request_created.html'
 }
@@ -177,6 +179,55 @@ class EmailService:
                 details={"error": str(e), "email": email}
             )
 
+    def send_login_notification(self, email: str, ip_address: str) -> str:
+        """
+        Send a new sign-in notification email.
+
+        Not wrapped as a task: users.tasks.send_login_notification already
+        runs it in a worker and owns the retry policy.
+
+        Args:
+            email: Recipient email address
+            ip_address: IP address the login came from
+
+        Returns:
+            str: Message ID from SES
+
+        Raises:
+            EmailError: If email sending fails
+        """
+        try:
+            context = {
+                'email': email,
+                'ip_address': ip_address
+            }
+            html_content = self.validate_and_render_template('login_notification', context)
+
+            message_id = self._ses_client.send_email(
+                to_address=email,
+                subject="New Sign-In to Your Arena Account",
+                html_content=html_content,
+                from_address=self._from_email
+            )
+
+            self.logger.info(
+                "Login notification email sent",
+                extra={
+                    'email': email,
+                    'message_id': message_id,
+                    'email_type': 'login_notification'
+                }
+            )
+
+            return message_id
+
+        except Exception as e:
+            raise EmailError(
+                message="Failed to send login notification",
+                code="E4001",
+                details={"error": str(e), "email": email}
+            )
+
     @shared_task(max_retries=MAX_RETRIES, retry_backoff=RETRY_BACKOFF)
     def send_proposal_received(
         self,
@@ -0,0 +1,5 @@
+"""
+Test package initialization file for the notifications app test suite.
+
+Version: 1.0.0
+"""
@@ -0,0 +1,58 @@
+"""
+Test suite for EmailService notification delivery.
+
+Tests cover:
+- Login notification rendering and delivery
+- Error wrapping for failed sends
+
+Version: 1.0.0
+"""
+
+import pytest
+from unittest.mock import patch
+
+from core.exceptions import EmailError
+from notifications.email import EmailService
+
+TEST_EMAIL = 'buyer@company.com'
+TEST_IP = '203.0.113.7'
+
+@pytest.fixture
+def ses_client():
+    """Replace the SES client built by EmailService."""
+    with patch('notifications.email.SESClient') as client_cls:
+        yield client_cls.return_value
+
+@pytest.fixture
+def render():
+    """Replace template rendering with a fixed body."""
+    with patch('notifications.email.render_to_string', return_value='<p>body</p>') as render:
+        yield render
+
+class TestLoginNotification:
+    """Test cases for EmailService.send_login_notification."""
+
+    def test_send_login_notification(self, ses_client, render):
+        """Test the notification renders its template and is sent to the user."""
+        ses_client.send_email.return_value = 'message-id'
+
+        message_id = EmailService().send_login_notification(
+            email=TEST_EMAIL,
+            ip_address=TEST_IP
+        )
+
+        assert message_id == 'message-id'
+        template_path, context = render.call_args[0]
+        assert template_path == 'email/login_notification.html'
+        assert context['ip_address'] == TEST_IP
+        assert ses_client.send_email.call_args[1]['to_address'] == TEST_EMAIL
+
+    def test_send_login_notification_failure(self, ses_client, render):
+        """Test delivery failures surface as EmailError."""
+        ses_client.send_email.side_effect = ConnectionError("SES unreachable")
+
+        with pytest.raises(EmailError):
+            EmailService().send_login_notification(
+                email=TEST_EMAIL,
+                ip_address=TEST_IP
+            )
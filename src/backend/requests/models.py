@@ -262,8 +262,11 @@ class Request(BaseModel):
         if not self.parsed_requirements:
             raise ValidationError("Requirements must be parsed before matching")
             
-        # Get active vendors
-        vendors = Vendor.objects.filter(status='active')
+        # Get active vendors; the large text/JSON columns are never read here,
+        # while the columns BaseModel.__init__ reads stay loaded
+        vendors = Vendor.objects.filter(status='active').defer(
+            'description', 'metadata'
+        )
         
         # Calculate match scores
         matches = []
@@ -11,7 +11,10 @@ Tests cover:
 Version: 1.0.0
 """
 
+from dataclasses import dataclass, field
 from datetime import timedelta
+from types import SimpleNamespace
+from uuid import uuid4
 from django.test import TestCase
 from django.utils import timezone
 from django.core.exceptions import ValidationError
@@ -22,6 +25,29 @@ from requests.models import Request, Requirement
 from users.models import User
 from core.constants import DataClassification, RequestStatus
 
+# Enum values bound once at module scope
+DRAFT = RequestStatus.DRAFT.value
+SUBMITTED = RequestStatus.SUBMITTED.value
+IN_REVIEW = RequestStatus.IN_REVIEW.value
+COMPLETED = RequestStatus.COMPLETED.value
+HIGHLY_SENSITIVE = DataClassification.HIGHLY_SENSITIVE.value
+SENSITIVE = DataClassification.SENSITIVE.value
+PUBLIC = DataClassification.PUBLIC.value
+
+# (status, expected retention days) cases for retention tests
+RETENTION_CASES = [
+    (DRAFT, 365),
+    (COMPLETED, 730)
+]
+
+# (from_status, to_status, should_raise) cases for status transition tests
+STATUS_TRANSITION_CASES = [
+    (DRAFT, SUBMITTED, False),
+    (SUBMITTED, IN_REVIEW, False),
+    (IN_REVIEW, DRAFT, True)
+]
+
+@freeze_time("2023-01-01")
 class RequestModelTest(TestCase):
     """Test cases for Request model functionality including security, retention and vendor matching."""
 
@@ -43,18 +69,14 @@ class RequestModelTest(TestCase):
                 "features": ["contact management", "email integration"],
                 "budget": "10000"
             },
-            status=RequestStatus.DRAFT.value
+            status=DRAFT
         )
 
-        # Set up vendor matcher mock
-        self.vendor_matcher = Mock()
-        self.vendor_matcher.match_score.return_value = 0.85
-
     def test_request_creation(self):
         """Test basic request creation with validation."""
         self.assertEqual(self.request.user, self.buyer)
-        self.assertEqual(self.request.status, RequestStatus.DRAFT.value)
-        self.assertEqual(self.request.data_classification, DataClassification.SENSITIVE.value)
+        self.assertEqual(self.request.status, DRAFT)
+        self.assertEqual(self.request.data_classification, SENSITIVE)
         self.assertTrue(self.request.is_anonymized)
         self.assertIsNotNone(self.request.expires_at)
 
@@ -63,43 +85,34 @@ class RequestModelTest(TestCase):
         # Verify default classification is SENSITIVE
         self.assertEqual(
             self.request.data_classification,
-            DataClassification.SENSITIVE.value
+            SENSITIVE
         )
 
         # Test setting invalid classification
         with self.assertRaises(ValidationError):
-            self.request.data_classification = DataClassification.PUBLIC.value
+            self.request.data_classification = PUBLIC
             self.request.save()
 
         # Test valid classification change
-        self.request.data_classification = DataClassification.HIGHLY_SENSITIVE.value
+        self.request.data_classification = HIGHLY_SENSITIVE
         self.request.save()
         self.assertEqual(
             self.request.data_classification,
-            DataClassification.HIGHLY_SENSITIVE.value
-        )
-
-    @freeze_time("2023-01-01")
-    def test_request_retention_active(self):
-        """Test retention period for active requests."""
-        # Verify 1 year retention for active requests
-        self.assertEqual(
-            self.request.expires_at,
-            timezone.now() + timedelta(days=365)
+            HIGHLY_SENSITIVE
         )
 
-    @freeze_time("2023-01-01")
-    def test_request_retention_completed(self):
-        """Test retention period changes when request is completed."""
-        # Complete the request
-        self.request.status = RequestStatus.COMPLETED.value
-        self.request.save()
+    def test_request_retention(self):
+        """Test retention period for active and completed requests."""
+        for status, expected_days in RETENTION_CASES:
+            with self.subTest(status=status):
+                self.request.status = status
+                self.request.save()
 
-        # Verify 2 year retention for completed requests
-        self.assertEqual(
-            self.request.expires_at,
-            timezone.now() + timedelta(days=730)
-        )
+                # Verify 1 year retention for active, 2 years for completed
+                self.assertEqual(
+                    self.request.expires_at,
+                    timezone.now() + timedelta(days=expected_days)
+                )
 
     def test_request_anonymization(self):
         """Test buyer identity anonymization controls."""
@@ -112,7 +125,7 @@ class RequestModelTest(TestCase):
             self.request.save()
 
         # Test valid identity reveal after completion
-        self.request.status = RequestStatus.COMPLETED.value
+        self.request.status = COMPLETED
         self.request.is_anonymized = False
         self.request.save()
         self.assertFalse(self.request.is_anonymized)
@@ -120,15 +133,14 @@ class RequestModelTest(TestCase):
     @patch('requests.models.Vendor.objects')
     def test_vendor_matching(self, mock_vendor_objects):
         """Test vendor matching functionality."""
-        # Set up vendor mock
-        mock_vendor = Mock()
-        mock_vendor.match_score.return_value = 0.85
-        mock_vendor_objects.filter.return_value = [mock_vendor]
+        # Set up vendor stub
+        mock_vendor = SimpleNamespace(pk=uuid4(), match_score=lambda *_: 0.85)
+        mock_vendor_objects.filter.return_value.defer.return_value = [mock_vendor]
 
         # Test matching with valid requirements
         matched_vendors = self.request.match_vendors()
         self.assertEqual(len(matched_vendors), 1)
-        self.assertEqual(self.request.status, RequestStatus.SUBMITTED.value)
+        self.assertEqual(self.request.status, SUBMITTED)
 
         # Test matching without parsed requirements
         self.request.parsed_requirements = {}
@@ -137,20 +149,19 @@ class RequestModelTest(TestCase):
 
     def test_request_status_transitions(self):
         """Test request status transitions and validation."""
-        # Test valid transition: DRAFT -> SUBMITTED
-        self.request.status = RequestStatus.SUBMITTED.value
-        self.request.save()
-        self.assertEqual(self.request.status, RequestStatus.SUBMITTED.value)
-
-        # Test valid transition: SUBMITTED -> IN_REVIEW
-        self.request.status = RequestStatus.IN_REVIEW.value
-        self.request.save()
-        self.assertEqual(self.request.status, RequestStatus.IN_REVIEW.value)
-
-        # Test invalid transition: IN_REVIEW -> DRAFT
-        with self.assertRaises(ValidationError):
-            self.request.status = RequestStatus.DRAFT.value
-            self.request.save()
+        for from_status, to_status, should_raise in STATUS_TRANSITION_CASES:
+            with self.subTest(from_status=from_status, to_status=to_status):
+                # Reset the stored status for this case
+                Request.objects.filter(pk=self.request.pk).update(status=from_status)
+                self.request.refresh_from_db()
+
+                self.request.status = to_status
+                if should_raise:
+                    with self.assertRaises(ValidationError):
+                        self.request.save()
+                else:
+                    self.request.save()
+                    self.assertEqual(self.request.status, to_status)
 
     def test_requirement_validation(self):
         """Test requirement creation and validation."""
@@ -162,7 +173,7 @@ class RequestModelTest(TestCase):
         )
 
         self.assertEqual(requirement.request, self.request)
-        self.assertEqual(requirement.data_classification, DataClassification.SENSITIVE.value)
+        self.assertEqual(requirement.data_classification, SENSITIVE)
 
         # Test invalid requirement type
         with self.assertRaises(ValidationError):
@@ -191,30 +202,36 @@ class RequestModelTest(TestCase):
             self.request.min_required_proposals
         )
 
-def create_test_request(user, data, security_config=None):
+@dataclass(frozen=True, slots=True)
+class RequestTestSpec:
+    """Request data and security settings used by create_test_request."""
+
+    requirements: str = ''
+    parsed_requirements: dict = field(default_factory=dict)
+    status: str = DRAFT
+    classification: str = SENSITIVE
+    anonymized: bool = True
+
+def create_test_request(user, spec=None):
     """
     Helper function to create test request instances with security controls.
 
     Args:
         user (User): Buyer user creating the request
-        data (dict): Request data
-        security_config (dict, optional): Security configuration overrides
+        spec (RequestTestSpec, optional): Request data and security overrides
 
     Returns:
         Request: Configured test request instance
     """
-    security_config = security_config or {}
-    
+    spec = spec or RequestTestSpec()
+
     request = Request.objects.create(
         user=user,
-        raw_requirements=data.get('requirements', ''),
-        parsed_requirements=data.get('parsed_requirements', {}),
-        status=data.get('status', RequestStatus.DRAFT.value),
-        data_classification=security_config.get(
-            'classification',
-            DataClassification.SENSITIVE.value
-        ),
-        is_anonymized=security_config.get('anonymized', True)
+        raw_requirements=spec.requirements,
+        parsed_requirements=spec.parsed_requirements,
+        status=spec.status,
+        data_classification=spec.classification,
+        is_anonymized=spec.anonymized
     )
 
-    return request
\ No newline at end of file
+    return request
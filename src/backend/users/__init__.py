@@ -9,6 +9,8 @@ This module exports:
 Version: 1.0.0
 """
 
+from django.core.exceptions import ValidationError
+
 from users.models import User
 from users.services import UserService
 
@@ -39,10 +41,8 @@ def create_user(email: str, role: str, **extra_fields) -> User:
     Raises:
         ValidationError: If email or role is invalid
     """
-    user_service = UserService()
-    
-    # Validate business email
-    if not user_service.validate_business_email(email):
+    # Validate business email (domain check is memoized at module scope)
+    if not UserService.validate_business_email(email):
         raise ValidationError('Invalid business email domain')
         
     # Create user with appropriate role
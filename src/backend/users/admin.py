@@ -7,13 +7,37 @@ Version: 1.0.0
 
 from django.contrib import admin  # v4.2+
 from django.contrib.auth.admin import UserAdmin  # v4.2+
+from django.contrib.admin.views.main import ChangeList
 from django.contrib import messages
-from django.utils import timezone
-from django.db.models import Q
 from django.core.exceptions import ValidationError
 
 from users.models import User
 
+# Columns loaded for the changelist; everything else (password hash etc.) is deferred
+USER_LIST_COLUMNS = [
+    'id',
+    'email',
+    'role',
+    'full_name',
+    'company',
+    'is_active',
+    'is_staff',
+    'last_login',
+    'created_at',
+    'updated_at',
+    # Read by BaseModel.__init__; deferring them costs a query per row
+    'data_classification',
+    'is_deleted',
+    'deleted_at'
+]
+
+class UserChangeList(ChangeList):
+    """Changelist that only selects the columns rendered in list_display."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.only(*USER_LIST_COLUMNS)
+
 @admin.register(User)
 class CustomUserAdmin(UserAdmin):
     """
@@ -128,21 +152,15 @@ class CustomUserAdmin(UserAdmin):
         Returns:
             QuerySet: Filtered user queryset
         """
-        qs = super().get_queryset(request)
-        
-        # Exclude soft-deleted users
-        qs = qs.filter(is_deleted=False)
-        
-        # Apply role-based filtering for non-superusers
-        if not request.user.is_superuser:
-            if request.user.is_arena_staff():
-                # Staff can see buyers but not other staff
-                qs = qs.filter(Q(role='buyer') | Q(id=request.user.id))
-            else:
-                # Buyers can only see themselves
-                qs = qs.filter(id=request.user.id)
-                
-        return qs
+        return User.objects.visible_for(request.user)
+
+    def get_changelist(self, request, **kwargs):
+        """
+        Use a changelist that defers columns not shown in the list view.
+
+        The change view keeps loading full rows via get_queryset.
+        """
+        return UserChangeList
 
     def get_last_modified(self, obj):
         """
@@ -183,9 +201,6 @@ class CustomUserAdmin(UserAdmin):
             if not change:  # New user
                 obj.data_classification = 'highly_sensitive'
             
-            # Track modification metadata
-            obj.updated_at = timezone.now()
-            
             if change and form.changed_data:
                 # Log changes for audit trail
                 changes = ', '.join(form.changed_data)
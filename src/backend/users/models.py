@@ -10,7 +10,10 @@ This module provides:
 Version: 1.0.0
 """
 
+import sys
+
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.core.exceptions import ValidationError
@@ -24,6 +27,31 @@ USER_ROLES = {
     'ARENA_STAFF': 'arena_staff'
 }
 
+# Precomputed role lookups; role strings are interned so loaded values share identity
+_BUYER_ROLE = sys.intern(USER_ROLES['BUYER'])
+_STAFF_ROLE = sys.intern(USER_ROLES['ARENA_STAFF'])
+_VALID_ROLES = frozenset(USER_ROLES.values())
+_ROLE_CHOICES = tuple((v, v) for v in USER_ROLES.values())
+
+# Shared email validator instance
+_EMAIL_VALIDATOR = EmailValidator()
+
+# Email domains that may not register; frozenset for O(1) lookups
+RESTRICTED_DOMAINS = frozenset([
+    'competitor.com',
+    'restricted.org'
+])
+
+class RoleField(models.CharField):
+    """CharField that interns role values loaded from the database."""
+
+    def from_db_value(self, value, expression, connection):
+        return sys.intern(value) if value is not None else value
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        return sys.intern(value) if value is not None else value
+
 class UserManager(BaseUserManager):
     """
     Custom user manager implementing secure user creation with role-based factory methods.
@@ -43,28 +71,25 @@ class UserManager(BaseUserManager):
             User: Created user instance
             
         Raises:
-            ValidationError: If email or role is invalid
+            ValidationError: If email or role is invalid or the domain is restricted
         """
         if not email:
             raise ValidationError('Email address is required')
             
-        # Validate and normalize email
-        email_validator = EmailValidator()
-        try:
-            email_validator(email)
-            email = self.normalize_email(email)
-        except ValidationError as e:
-            raise ValidationError('Invalid email address') from e
+        # Normalize and validate email
+        email = self.normalize_email(email)
+        _EMAIL_VALIDATOR(email)
+        if email.rsplit('@', 1)[1] in RESTRICTED_DOMAINS:
+            raise ValidationError('Email domain is not allowed')
             
         # Validate role
-        if role not in USER_ROLES.values():
+        if role not in _VALID_ROLES:
             raise ValidationError(f'Invalid role: {role}')
             
         # Create user instance
         user = self.model(
             email=email,
             role=role,
-            data_classification=DataClassification.HIGHLY_SENSITIVE.value,
             **extra_fields
         )
         
@@ -117,6 +142,26 @@ class UserManager(BaseUserManager):
             **extra_fields
         )
 
+    def visible_for(self, user):
+        """
+        Return non-deleted users visible to the given user based on role.
+
+        Superusers see everyone, Arena staff see buyers and themselves,
+        and buyers only see themselves.
+
+        Args:
+            user (User): User requesting access
+
+        Returns:
+            QuerySet: Filtered user queryset
+        """
+        qs = self.filter(is_deleted=False)
+        if user.is_superuser:
+            return qs
+        if user.is_arena_staff():
+            return qs.filter(Q(role=USER_ROLES['BUYER']) | Q(id=user.id))
+        return qs.filter(id=user.id)
+
 class User(AbstractBaseUser, PermissionsMixin, BaseModel):
     """
     Custom user model implementing secure authentication and role-based access control.
@@ -138,9 +183,9 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
         help_text='Business email address used for authentication'
     )
     
-    role = models.CharField(
+    role = RoleField(
         max_length=20,
-        choices=[(v, v) for v in USER_ROLES.values()],
+        choices=_ROLE_CHOICES,
         help_text='User role determining permissions and access'
     )
     
@@ -163,6 +208,22 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
         default=False,
         help_text='Whether user can access admin interface'
     )
+
+    # User data is always highly sensitive; set by column default rather than on save
+    data_classification = models.CharField(
+        max_length=20,
+        choices=[(dc.value, dc.name) for dc in DataClassification],
+        default=DataClassification.HIGHLY_SENSITIVE.value,
+        db_index=True
+    )
+
+    last_login = models.DateTimeField(
+        'last login',
+        blank=True,
+        null=True,
+        default=timezone.now,
+        help_text='Last login timestamp, initialized on creation'
+    )
     
     # Configure user model settings
     objects = UserManager()
@@ -185,16 +246,18 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
         if self.data_classification != DataClassification.HIGHLY_SENSITIVE.value:
             raise ValidationError('User data must be classified as highly sensitive')
             
-    def save(self, *args, **kwargs):
-        """Override save to enforce security controls."""
-        # Set data classification
-        self.data_classification = DataClassification.HIGHLY_SENSITIVE.value
-        
-        # Update last login if not set
-        if not self.last_login:
-            self.last_login = timezone.now()
-            
-        super().save(*args, **kwargs)
+    def validate_model_specific_classification(self, classification):
+        """
+        Enforce highly sensitive classification for user data on save.
+
+        Args:
+            classification (DataClassification): Classification to validate
+
+        Raises:
+            ValidationError: If classification is not highly sensitive
+        """
+        if classification != DataClassification.HIGHLY_SENSITIVE:
+            raise ValidationError('User data must be classified as highly sensitive')
         
     def get_full_name(self):
         """Return user's full name."""
@@ -206,8 +269,8 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
         
     def is_buyer(self):
         """Check if user has buyer role."""
-        return self.role == USER_ROLES['BUYER']
+        return self.role == _BUYER_ROLE
         
     def is_arena_staff(self):
         """Check if user has staff role."""
-        return self.role == USER_ROLES['ARENA_STAFF']
\ No newline at end of file
+        return self.role == _STAFF_ROLE
\ No newline at end of file
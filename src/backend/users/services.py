@@ -11,23 +11,33 @@ This module provides:
 Version: 1.0.0
 """
 
+import hashlib
+import json
 import logging
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from datetime import datetime, timedelta
 
 # Third-party imports
 import jwt  # version: 2.8.0
+from cryptography.hazmat.primitives import serialization  # version: 41.0.0
 from google.auth.transport import requests
 from google.oauth2 import id_token
 from google_auth_oauthlib.flow import Flow  # version: 1.0.0
-from celery import shared_task  # version: 5.3+
+from django.conf import settings  # version: 4.2+
 from django.core.cache import cache  # version: 4.2+
+from django.db.models import DEFERRED, prefetch_related_objects  # version: 4.2+
+from django_redis import get_redis_connection  # version: 5.3+
+from django.utils import timezone  # version: 4.2+
 from ratelimit import RateLimiter  # version: 4.0+
 
 # Internal imports
 from users.models import User
-from core.utils.encryption import encrypt_data, decrypt_data
+from users.tasks import send_login_notification, send_magic_link_email
+from core.utils.encryption import encrypt_many, decrypt_data
+from core.utils.validators import PERSONAL_EMAIL_DOMAINS
 from notifications.email import EmailService
+from integrations.aws.ses import is_allowed_domain
 from core.exceptions import AuthenticationError, SystemError
 from core.constants import DataClassification
 
@@ -38,6 +48,109 @@ GOOGLE_OAUTH_CLIENT_ID = settings.GOOGLE_OAUTH_CLIENT_ID
 MAX_AUTH_ATTEMPTS = 3
 AUTH_ATTEMPT_WINDOW = 3600  # 1 hour
 SENSITIVE_FIELDS = ['company', 'phone', 'position']
+USER_CACHE_TIMEOUT = 3600  # 1 hour
+USER_CACHE_FIELDS = (
+    'id',
+    'email',
+    'role',
+    'full_name',
+    'company',
+    'is_active',
+    'is_staff',
+    'is_superuser',
+    'last_login',
+    'data_classification',
+    # Read by BaseModel.__init__ on rebuild
+    'created_at',
+    'updated_at',
+    'is_deleted',
+    'deleted_at'
+)
+# BaseModel.__init__ reads the timestamp, classification and soft-delete
+# columns, so they must be loaded to avoid a deferred query per field
+AUTH_USER_FIELDS = (
+    'id',
+    'email',
+    'role',
+    'last_login',
+    'is_active',
+    'is_staff',
+    'data_classification',
+    'created_at',
+    'updated_at',
+    'is_deleted',
+    'deleted_at'
+)
+SES_VERIFIED_CACHE_TIMEOUT = 86400  # 24 hours
+AUTH_PREFETCH = ('groups', 'user_permissions')  # Used by downstream permission checks
+
+# Reusable HTTP transport for Google token verification
+_GOOGLE_TRANSPORT = requests.Request()
+
+
+@lru_cache(maxsize=1)
+def _jwt_private_key():
+    """Parse the PEM-encoded JWT signing key once per process."""
+    return serialization.load_pem_private_key(
+        settings.JWT_PRIVATE_KEY.encode(),
+        password=None
+    )
+
+
+@lru_cache(maxsize=1)
+def _jwt_public_key():
+    """Parse the PEM-encoded JWT verification key once per process."""
+    return serialization.load_pem_public_key(settings.JWT_PUBLIC_KEY.encode())
+
+
+@lru_cache(maxsize=1)
+def _token_hasher():
+    """
+    Build the keyed BLAKE2b hasher used for token cache keys once per process.
+
+    Falls back to a key derived from SECRET_KEY when TOKEN_HASH_KEY is unset,
+    so token digests are never computed unkeyed.
+    """
+    key = settings.TOKEN_HASH_KEY.encode()
+    if not key:
+        key = hashlib.sha256(b'token-hash-key:' + settings.SECRET_KEY.encode()).digest()
+    return hashlib.blake2b(digest_size=16, key=key)
+
+
+def _token_digest(token: str) -> str:
+    """Return the keyed 128-bit digest of a token for use in cache keys."""
+    hasher = _token_hasher().copy()
+    hasher.update(token.encode())
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _google_client_config() -> Dict:
+    """
+    Load and parse the Google OAuth client secrets file once per process.
+
+    Returns:
+        Dict: Parsed client configuration
+    """
+    with open(settings.GOOGLE_OAUTH_CLIENT_SECRETS_FILE) as secrets_file:
+        return json.load(secrets_file)
+
+
+@lru_cache(maxsize=4096)
+def _is_business_domain(domain: str) -> bool:
+    """
+    Check whether an email domain is acceptable for a business account.
+
+    Results are memoized per lowercased domain so bulk user creation only
+    evaluates each distinct domain once.
+
+    Args:
+        domain: Lowercased email domain
+
+    Returns:
+        bool: True if the domain is a business domain
+    """
+    return bool(domain) and domain not in PERSONAL_EMAIL_DOMAINS
 
 class UserService:
     """
@@ -50,15 +163,102 @@ class UserService:
         Initialize user service with required dependencies.
 
         Args:
-            email_service: Service for sending emails
+            email_service: Email service whose SES client validates recipient
+                addresses; delivery itself goes through the users.tasks Celery
+                tasks, which build their own EmailService in the worker
             rate_limiter: Rate limiting service
         """
         self._email_service = email_service
         self._rate_limiter = rate_limiter
         self._logger = logging.getLogger(__name__)
         self._cache = cache
+        self._raw_redis = self._get_raw_redis()
+
+    def check_rate_limit(self, ip_address: str) -> int:
+        """
+        Count an authentication attempt for an IP and enforce the rate limit.
+
+        The counter is created with its expiry only if absent and then
+        incremented atomically, so the window starts at the first attempt.
+        On Redis both commands are sent in a single pipelined round-trip.
+
+        Args:
+            ip_address: Request IP address
+
+        Returns:
+            int: Number of attempts in the current window
+
+        Raises:
+            AuthenticationError: If rate limit exceeded
+        """
+        rate_key = f"auth_attempts:{ip_address}"
+        if self._raw_redis is not None:
+            redis_key = self._cache.make_key(rate_key)
+            with self._raw_redis.pipeline() as pipe:
+                pipe.set(redis_key, 0, ex=AUTH_ATTEMPT_WINDOW, nx=True)
+                pipe.incr(redis_key)
+                attempts = pipe.execute()[1]
+        else:
+            self._cache.add(rate_key, 0, timeout=AUTH_ATTEMPT_WINDOW)
+            attempts = self._cache.incr(rate_key)
+        if attempts > MAX_AUTH_ATTEMPTS:
+            raise AuthenticationError(
+                message="Too many authentication attempts",
+                code="E1001",
+                details={"ip_address": ip_address}
+            )
+        return attempts
+
+    @staticmethod
+    def _get_raw_redis():
+        """Return the pooled Redis client behind the cache, if Redis-backed."""
+        try:
+            return get_redis_connection('default')
+        except NotImplementedError:
+            return None
+
+    def _is_deliverable_email(self, email: str) -> bool:
+        """
+        Validate a login email, avoiding SES round-trips where possible.
+
+        Disallowed domains are rejected from a memoized domain check without
+        touching SES. Addresses SES has already verified are remembered so
+        repeat logins skip the lookup; failures are never cached.
+
+        Args:
+            email: Email address to validate
+
+        Returns:
+            bool: True if the email is allowed and verified
+        """
+        if not is_allowed_domain(email.rsplit('@', 1)[-1]):
+            return False
+
+        verified_key = f"ses_verified:{email.lower()}"
+        if self._cache.get(verified_key):
+            return True
+
+        if not self._email_service._ses_client.validate_email_address(email):
+            return False
+
+        self._cache.set(verified_key, True, timeout=SES_VERIFIED_CACHE_TIMEOUT)
+        return True
+
+    @staticmethod
+    def validate_business_email(email: str) -> bool:
+        """
+        Validate that an email address belongs to a business domain.
+
+        Args:
+            email: Email address to validate
+
+        Returns:
+            bool: True if the email uses a business domain
+        """
+        if not email or '@' not in email:
+            return False
+        return _is_business_domain(email.rsplit('@', 1)[1].lower())
 
-    @shared_task
     def create_magic_link(self, email: str, ip_address: str) -> bool:
         """
         Generate and send secure magic link with rate limiting.
@@ -75,16 +275,10 @@ class UserService:
         """
         try:
             # Check rate limits
-            rate_key = f"auth_attempts:{ip_address}"
-            if self._cache.get(rate_key, 0) >= MAX_AUTH_ATTEMPTS:
-                raise AuthenticationError(
-                    message="Too many authentication attempts",
-                    code="E1001",
-                    details={"ip_address": ip_address}
-                )
+            self.check_rate_limit(ip_address)
 
             # Validate business email domain
-            if not self._email_service._ses_client.validate_email_address(email):
+            if not self._is_deliverable_email(email):
                 raise AuthenticationError(
                     message="Invalid business email domain",
                     code="E1001",
@@ -98,27 +292,18 @@ class UserService:
                 "exp": expiry,
                 "type": "magic_link"
             }
-            token = jwt.encode(
-                token_data,
-                settings.JWT_PRIVATE_KEY,
-                algorithm=JWT_ALGORITHM
-            )
+            token = self._generate_token(token_data)
 
             # Create magic link URL
             magic_link_url = f"{settings.FRONTEND_URL}/auth/verify?token={token}"
 
-            # Send email
-            self._email_service.send_magic_link(
+            # Queue email delivery off the request path
+            send_magic_link_email.delay(
                 email=email,
                 user_name=email.split('@')[0],
                 magic_link_url=magic_link_url
             )
 
-            # Update rate limiting
-            self._cache.incr(rate_key)
-            if not self._cache.ttl(rate_key):
-                self._cache.expire(rate_key, AUTH_ATTEMPT_WINDOW)
-
             # Log authentication attempt
             self._logger.info(
                 "Magic link sent",
@@ -157,20 +342,17 @@ class UserService:
             AuthenticationError: If token is invalid or expired
         """
         try:
-            # Verify JWT signature and expiry
-            try:
-                payload = jwt.decode(
-                    token,
-                    settings.JWT_PUBLIC_KEY,
-                    algorithms=[JWT_ALGORITHM]
-                )
-            except jwt.InvalidTokenError as e:
+            # Check for token reuse
+            token_key = f"used_token:{_token_digest(token)}"
+            if self._cache.get(token_key):
                 raise AuthenticationError(
-                    message="Invalid or expired magic link",
-                    code="E1003",
-                    details={"error": str(e)}
+                    message="Magic link already used",
+                    code="E1003"
                 )
 
+            # Verify JWT signature and expiry
+            payload = self._decode_token(token)
+
             email = payload.get("email")
             if not email:
                 raise AuthenticationError(
@@ -178,26 +360,20 @@ class UserService:
                     code="E1003"
                 )
 
-            # Check for token reuse
-            token_key = f"used_token:{token}"
-            if self._cache.get(token_key):
-                raise AuthenticationError(
-                    message="Magic link already used",
-                    code="E1003"
-                )
             self._cache.set(token_key, True, timeout=86400)  # 24 hour retention
 
-            # Get or create user
-            user = self.get_user_by_email(email)
+            # Get or create user, recording the login in the same write
+            now = timezone.now()
+            user = self.get_user_by_email_lite(email)
             if not user:
-                user = User.objects.create_buyer(email=email)
-
-            # Update last login
-            user.last_login = datetime.utcnow()
-            user.save()
-
-            # Send login notification
-            self._email_service.send_login_notification(
+                user = User.objects.create_buyer(email=email, last_login=now)
+                prefetch_related_objects([user], *AUTH_PREFETCH)
+            else:
+                user.last_login = now
+                user.save(update_fields=['last_login'])
+
+            # Queue login notification off the request path
+            send_login_notification.delay(
                 email=email,
                 ip_address=ip_address
             )
@@ -224,6 +400,44 @@ class UserService:
             )
             raise
 
+    @staticmethod
+    def _generate_token(token_data: Dict) -> str:
+        """Sign magic link claims with the JWT private key."""
+        return jwt.encode(
+            token_data,
+            _jwt_private_key(),
+            algorithm=JWT_ALGORITHM
+        )
+
+    @staticmethod
+    def _decode_token(token: str) -> Dict:
+        """
+        Decode and verify a magic link JWT.
+
+        Args:
+            token: JWT token from magic link
+
+        Returns:
+            Dict: Verified token claims
+
+        Raises:
+            AuthenticationError: If token is invalid or expired
+        """
+        try:
+            payload = jwt.decode(
+                token,
+                _jwt_public_key(),
+                algorithms=[JWT_ALGORITHM]
+            )
+        except jwt.InvalidTokenError as e:
+            raise AuthenticationError(
+                message="Invalid or expired magic link",
+                code="E1003",
+                details={"error": str(e)}
+            )
+
+        return payload
+
     def authenticate_google(self, auth_code: str, ip_address: str) -> User:
         """
         Authenticate user with Google OAuth and business email validation.
@@ -240,18 +454,12 @@ class UserService:
         """
         try:
             # Check rate limits
-            rate_key = f"auth_attempts:{ip_address}"
-            if self._cache.get(rate_key, 0) >= MAX_AUTH_ATTEMPTS:
-                raise AuthenticationError(
-                    message="Too many authentication attempts",
-                    code="E1001",
-                    details={"ip_address": ip_address}
-                )
+            self.check_rate_limit(ip_address)
 
             # Verify Google OAuth code
             try:
-                flow = Flow.from_client_secrets_file(
-                    settings.GOOGLE_OAUTH_CLIENT_SECRETS_FILE,
+                flow = Flow.from_client_config(
+                    _google_client_config(),
                     scopes=['openid', 'email', 'profile']
                 )
                 flow.fetch_token(code=auth_code)
@@ -259,7 +467,7 @@ class UserService:
                 
                 id_info = id_token.verify_oauth2_token(
                     credentials.id_token,
-                    requests.Request(),
+                    _GOOGLE_TRANSPORT,
                     GOOGLE_OAUTH_CLIENT_ID
                 )
             except Exception as e:
@@ -277,36 +485,33 @@ class UserService:
                 )
 
             # Validate business email
-            if not self._email_service._ses_client.validate_email_address(email):
+            if not self._is_deliverable_email(email):
                 raise AuthenticationError(
                     message="Invalid business email domain",
                     code="E1001",
                     details={"email": email}
                 )
 
-            # Get or create user
-            user = self.get_user_by_email(email)
+            # Get or create user, recording the login in the same write
+            now = timezone.now()
+            user = self.get_user_by_email_lite(email)
             if not user:
                 user = User.objects.create_buyer(
                     email=email,
-                    full_name=id_info.get('name', '')
+                    full_name=id_info.get('name', ''),
+                    last_login=now
                 )
+                prefetch_related_objects([user], *AUTH_PREFETCH)
+            else:
+                user.last_login = now
+                user.save(update_fields=['last_login'])
 
-            # Update last login
-            user.last_login = datetime.utcnow()
-            user.save()
-
-            # Send login notification
-            self._email_service.send_login_notification(
+            # Queue login notification off the request path
+            send_login_notification.delay(
                 email=email,
                 ip_address=ip_address
             )
 
-            # Update rate limiting
-            self._cache.incr(rate_key)
-            if not self._cache.ttl(rate_key):
-                self._cache.expire(rate_key, AUTH_ATTEMPT_WINDOW)
-
             # Log successful authentication
             self._logger.info(
                 "Google OAuth authentication successful",
@@ -354,13 +559,13 @@ class UserService:
                     details={"invalid_fields": list(invalid_fields)}
                 )
 
-            # Encrypt sensitive fields
-            for field in SENSITIVE_FIELDS:
-                if field in profile_data:
-                    profile_data[field] = encrypt_data(
-                        profile_data[field],
-                        DataClassification.HIGHLY_SENSITIVE
-                    )
+            # Encrypt sensitive fields with a single data key
+            sensitive = [field for field in SENSITIVE_FIELDS if field in profile_data]
+            encrypted = encrypt_many(
+                [profile_data[field] for field in sensitive],
+                DataClassification.HIGHLY_SENSITIVE
+            )
+            profile_data.update(zip(sensitive, encrypted))
 
             # Update user model
             for field, value in profile_data.items():
@@ -368,7 +573,7 @@ class UserService:
             user.save()
 
             # Invalidate user cache
-            self._cache.delete(f"user:{user.email}")
+            self._cache.delete_many([f"user:{user.email}", f"user:id:{user.id}"])
 
             # Log profile update
             self._logger.info(
@@ -395,6 +600,10 @@ class UserService:
         """
         Retrieve user by email with caching.
 
+        The cache stores a lean dict of USER_CACHE_FIELDS under both the email
+        and id keys; cache hits are rebuilt with ``User.from_db`` so fields
+        that were not cached stay deferred instead of being overwritten.
+
         Args:
             email: User's email address
 
@@ -403,15 +612,56 @@ class UserService:
         """
         # Check cache first
         cache_key = f"user:{email}"
-        user = self._cache.get(cache_key)
-        if user:
-            return user
+        cached = self._cache.get(cache_key)
+        if cached:
+            return self._user_from_cache(cached)
 
         # Query database
         try:
-            user = User.objects.get(email=email)
-            # Cache user object
-            self._cache.set(cache_key, user, timeout=3600)  # 1 hour cache
-            return user
+            user = User.objects.prefetch_related(*AUTH_PREFETCH).get(email=email)
         except User.DoesNotExist:
-            return None
\ No newline at end of file
+            return None
+
+        # Cache lean user representation
+        cached = {field: getattr(user, field) for field in USER_CACHE_FIELDS}
+        self._cache.set_many(
+            {cache_key: cached, f"user:id:{user.id}": cached},
+            timeout=USER_CACHE_TIMEOUT
+        )
+        return user
+
+    def get_user_by_email_lite(self, email: str) -> Optional[User]:
+        """
+        Retrieve user by email loading only the columns authentication needs.
+
+        Used on the login hot paths; remaining columns are deferred and load
+        on access. Cached users are reused when present.
+
+        Args:
+            email: User's email address
+
+        Returns:
+            Optional[User]: User instance if found
+        """
+        cached = self._cache.get(f"user:{email}")
+        if cached:
+            return self._user_from_cache(cached)
+
+        try:
+            return User.objects.only(*AUTH_USER_FIELDS).prefetch_related(
+                *AUTH_PREFETCH
+            ).get(email=email)
+        except User.DoesNotExist:
+            return None
+
+    @staticmethod
+    def _user_from_cache(cached: Dict) -> User:
+        """
+        Rebuild a user from its cached field dict, deferring other columns.
+
+        from_db assigns a full row positionally, so values are laid out in
+        concrete field order with DEFERRED for columns that were not cached.
+        """
+        field_names = [field.attname for field in User._meta.concrete_fields]
+        values = [cached.get(name, DEFERRED) for name in field_names]
+        return User.from_db(User.objects.db, field_names, values)
@@ -0,0 +1,83 @@
+"""
+Signal handlers for the users module of the Arena MVP platform.
+
+This module provides:
+- Role group initialization after migrations
+- Login/logout audit logging
+- Password change and security event logging
+
+Handlers decorated with ``receiver`` are connected when this module is
+imported from ``UsersConfig.ready()``.
+
+Version: 1.0.0
+"""
+
+import logging
+
+from django.contrib.auth.signals import user_logged_in, user_logged_out
+from django.dispatch import Signal, receiver
+
+from users.models import User, USER_ROLES
+
+# Configure security event logging
+logger = logging.getLogger(__name__)
+
+# Custom user signals
+password_changed = Signal()
+security_event = Signal()
+
+
+def initialize_user_roles(sender, **kwargs):
+    """
+    Ensure an auth group exists for every user role after migrations.
+
+    Args:
+        sender: App config that finished migrating
+        **kwargs: Additional signal arguments
+    """
+    from django.contrib.auth.models import Group
+
+    for role in USER_ROLES.values():
+        Group.objects.get_or_create(name=role)
+
+
+@receiver(user_logged_in, sender=User)
+def handle_user_login(sender, request, user, **kwargs):
+    """Log successful user login for audit trail."""
+    logger.info(
+        "User logged in",
+        extra={"user_id": str(user.id), "event": "login"}
+    )
+
+
+@receiver(user_logged_out, sender=User)
+def handle_user_logout(sender, request, user, **kwargs):
+    """Log user logout for audit trail."""
+    if user is None:
+        return
+    logger.info(
+        "User logged out",
+        extra={"user_id": str(user.id), "event": "logout"}
+    )
+
+
+@receiver(password_changed, sender=User)
+def handle_password_change(sender, user, **kwargs):
+    """Log password changes for audit trail."""
+    logger.info(
+        "User password changed",
+        extra={"user_id": str(user.id), "event": "password_change"}
+    )
+
+
+@receiver(security_event, sender=User)
+def handle_security_event(sender, user, event_type, **kwargs):
+    """Log security events raised for a user."""
+    logger.warning(
+        "User security event",
+        extra={
+            "user_id": str(user.id),
+            "event": "security_event",
+            "event_type": event_type
+        }
+    )
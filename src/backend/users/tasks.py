@@ -0,0 +1,60 @@
+"""
+Celery tasks for delivering user authentication emails off the request path.
+
+This module implements:
+- Magic link email delivery
+- Login notification delivery
+- Rate-limited, retried email sending
+
+Version: 1.0.0
+"""
+
+from celery import shared_task
+
+from core.exceptions import EmailError
+from notifications.email import EmailService
+
+# Task configuration
+EMAIL_TASK_RATE_LIMIT = '100/s'
+MAX_RETRIES = 3
+RETRY_BACKOFF = 60  # 1 minute
+
+@shared_task(
+    rate_limit=EMAIL_TASK_RATE_LIMIT,
+    autoretry_for=(EmailError,),
+    max_retries=MAX_RETRIES,
+    retry_backoff=RETRY_BACKOFF
+)
+def send_magic_link_email(email: str, user_name: str, magic_link_url: str) -> None:
+    """
+    Send a magic link authentication email.
+
+    Args:
+        email: Recipient email address
+        user_name: User's name for personalization
+        magic_link_url: One-time authentication URL
+    """
+    EmailService().send_magic_link(
+        email=email,
+        user_name=user_name,
+        magic_link_url=magic_link_url
+    )
+
+@shared_task(
+    rate_limit=EMAIL_TASK_RATE_LIMIT,
+    autoretry_for=(EmailError,),
+    max_retries=MAX_RETRIES,
+    retry_backoff=RETRY_BACKOFF
+)
+def send_login_notification(email: str, ip_address: str) -> None:
+    """
+    Send a login notification email.
+
+    Args:
+        email: Recipient email address
+        ip_address: IP address the login came from
+    """
+    EmailService().send_login_notification(
+        email=email,
+        ip_address=ip_address
+    )
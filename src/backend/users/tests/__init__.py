@@ -35,6 +35,17 @@ DATA_CLASSIFICATION_PUBLIC = DataClassification.PUBLIC.value
 TEST_ENVIRONMENT = 'test'
 SECURITY_VALIDATION_ENABLED = True
 
+# Security defaults applied to user test classes via override_settings
+USER_SECURITY_SETTINGS = {
+    'SESSION_COOKIE_SECURE': True,
+    'SESSION_COOKIE_HTTPONLY': True,
+    'AUTHENTICATION_BACKENDS': [
+        'users.auth.MagicLinkBackend',
+        'users.auth.GoogleOAuthBackend',
+        'django.contrib.auth.backends.ModelBackend'
+    ]
+}
+
 @pytest.fixture(scope='session')
 def configure_test_environment(environment: str = TEST_ENVIRONMENT, 
                              security_validation: bool = SECURITY_VALIDATION_ENABLED):
@@ -121,6 +132,7 @@ __all__ = [
     'UserFactory',
     'BuyerFactory', 
     'ArenaStaffFactory',
+    'USER_SECURITY_SETTINGS',
     'configure_test_environment',
     'validate_data_classification'
 ]
\ No newline at end of file
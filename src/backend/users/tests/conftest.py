@@ -0,0 +1,129 @@
+"""
+Shared pytest fixtures for the users app test suite.
+
+Template users are created once per test session outside the per-test
+transaction and removed again at session teardown; each test re-fetches its
+own instance by primary key so mutations are rolled back with the test.
+
+Version: 1.0.0
+"""
+
+from functools import lru_cache
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from core.utils import encryption
+from notifications.email import EmailService
+from users.models import User
+from users.services import UserService
+from users.tests.factories import BuyerFactory, ArenaStaffFactory
+
+# Memoized KMS key operations; defined at module scope so they are created once
+_cached_generate_data_key = lru_cache(maxsize=1)(encryption._generate_data_key)
+_cached_decrypt_data_key = lru_cache(maxsize=None)(encryption._decrypt_data_key)
+
+# Memoized JWT signing; claims are deterministic under freeze_time
+_sign_token = UserService._generate_token
+
+@lru_cache(maxsize=256)
+def _cached_sign_token(token_items):
+    return _sign_token(dict(token_items))
+
+def _generate_token_cached(token_data):
+    return _cached_sign_token(tuple(sorted(token_data.items())))
+
+@pytest.fixture(scope='session', autouse=True)
+def _fast_token_signing():
+    """Reuse RS256 signatures for identical token claims across the session."""
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(UserService, '_generate_token', staticmethod(_generate_token_cached))
+        yield
+
+@pytest.fixture(scope='session', autouse=True)
+def _fast_encryption():
+    """
+    Reuse one data key and memoize key decryption for the whole session.
+
+    Trades per-value key freshness for speed; ciphertexts still get a fresh
+    IV each. Password hashing is already fast via MD5PasswordHasher in
+    arena.settings.test.
+    """
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(encryption, '_generate_data_key', _cached_generate_data_key)
+        patcher.setattr(encryption, '_decrypt_data_key', _cached_decrypt_data_key)
+        yield
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start every test with an empty cache so rate-limit counters never leak."""
+    cache.clear()
+    yield
+
+@pytest.fixture(scope='session')
+def _template_buyer(django_db_setup, django_db_blocker):
+    """Create the session-wide template buyer and yield its primary key."""
+    with django_db_blocker.unblock():
+        pk = BuyerFactory().pk
+    yield pk
+    with django_db_blocker.unblock():
+        User.objects.filter(pk=pk).delete()
+
+@pytest.fixture(scope='session')
+def _template_staff(django_db_setup, django_db_blocker):
+    """Create the session-wide template staff user and yield its primary key."""
+    with django_db_blocker.unblock():
+        pk = ArenaStaffFactory().pk
+    yield pk
+    with django_db_blocker.unblock():
+        User.objects.filter(pk=pk).delete()
+
+def _refuse_write(*args, **kwargs):
+    raise AssertionError("Shared template users are read-only; use the buyer/staff fixtures")
+
+def _read_only(user):
+    """Block save() and delete() on a class-shared instance."""
+    user.save = _refuse_write
+    user.delete = _refuse_write
+    return user
+
+@pytest.fixture(scope='class')
+def shared_buyer(_template_buyer, django_db_blocker):
+    """Read-only template buyer loaded once per test class."""
+    with django_db_blocker.unblock():
+        return _read_only(User.objects.get(pk=_template_buyer))
+
+@pytest.fixture(scope='class')
+def shared_staff(_template_staff, django_db_blocker):
+    """Read-only template staff user loaded once per test class."""
+    with django_db_blocker.unblock():
+        return _read_only(User.objects.get(pk=_template_staff))
+
+@pytest.fixture
+def buyer(_template_buyer, db):
+    """Fresh instance of the template buyer for the current test."""
+    return User.objects.get(pk=_template_buyer)
+
+@pytest.fixture
+def staff(_template_staff, db):
+    """Fresh instance of the template staff user for the current test."""
+    return User.objects.get(pk=_template_staff)
+
+@pytest.fixture(scope='module')
+def email_service_spec():
+    """
+    Attribute names of EmailService, introspected once per module.
+
+    Includes the instance-level SES client, which class introspection misses.
+    """
+    return sorted(set(dir(EmailService)) | {'_ses_client'})
+
+@pytest.fixture
+def email_service(email_service_spec):
+    """Fresh EmailService mock built from the cached spec."""
+    return Mock(spec_set=email_service_spec)
+
+@pytest.fixture
+def rate_limiter():
+    """Fresh rate limiter mock."""
+    return Mock()
@@ -9,7 +9,11 @@ This module provides:
 Version: 1.0.0
 """
 
+import re
+from functools import lru_cache
+
 import factory
+from django.contrib.auth.hashers import make_password
 from faker import Faker
 from users.models import User
 from core.constants import DataClassification
@@ -34,6 +38,43 @@ RESTRICTED_PATTERNS = [
     'test'
 ]
 
+# Restricted patterns compiled into a single case-insensitive search
+_RESTRICTED_RE = re.compile(
+    '|'.join(map(re.escape, RESTRICTED_PATTERNS)),
+    re.IGNORECASE
+)
+
+# Bounded retries before falling back to sanitization
+MAX_GENERATION_ATTEMPTS = 5
+
+def _generate_sanitized(generate, fallback):
+    """
+    Generate a value free of restricted patterns.
+
+    Args:
+        generate (callable): Zero-argument value generator
+        fallback (str): Value used if sanitization leaves nothing
+
+    Returns:
+        str: Generated value without restricted patterns
+    """
+    for _ in range(MAX_GENERATION_ATTEMPTS):
+        value = generate()
+        if not _RESTRICTED_RE.search(value):
+            return value
+    return _RESTRICTED_RE.sub('', value).strip(' ._-') or fallback
+
+# Hash generated passwords; tests that authenticate pass password='...' to hash one
+HASH_GENERATED_PASSWORDS = False
+
+# Shared plain-text password for bulk-created users
+BULK_USER_PASSWORD = 'Bulk-Test-Pass-1!'
+
+@lru_cache(maxsize=1)
+def _bulk_password_hash():
+    """Hash the shared bulk password once per test session."""
+    return make_password(BULK_USER_PASSWORD)
+
 class UserFactory(factory.django.DjangoModelFactory):
     """
     Base factory class for generating secure User model test instances.
@@ -49,52 +90,45 @@ class UserFactory(factory.django.DjangoModelFactory):
         model = User
         
     # Basic user attributes with security validation
-    email = factory.LazyAttribute(lambda o: faker.email())
-    full_name = factory.LazyAttribute(lambda o: faker.name())
-    company = factory.LazyAttribute(lambda o: faker.company())
     is_active = True
     data_classification = DataClassification.HIGHLY_SENSITIVE.value
     
     @factory.lazy_attribute
     def email(self):
-        """Generate secure business email with domain validation."""
-        while True:
-            email = faker.email()
-            domain = email.split('@')[1]
-            
-            # Validate against allowed domains
-            if domain in ALLOWED_EMAIL_DOMAINS:
-                # Check for restricted patterns
-                if not any(pattern in email.lower() for pattern in RESTRICTED_PATTERNS):
-                    return email
+        """Generate secure business email on an allowed domain."""
+        local_part = _generate_sanitized(faker.user_name, 'user')
+        return f"{local_part}@{faker.random_element(ALLOWED_EMAIL_DOMAINS)}"
                     
     @factory.lazy_attribute 
     def full_name(self):
         """Generate sanitized full name."""
-        while True:
-            name = faker.name()
-            # Validate against restricted patterns
-            if not any(pattern in name.lower() for pattern in RESTRICTED_PATTERNS):
-                return name
+        return _generate_sanitized(faker.name, 'Jane Doe')
                 
     @factory.lazy_attribute
     def company(self):
         """Generate validated company name."""
-        while True:
-            company = faker.company()
-            # Validate against restricted patterns
-            if not any(pattern in company.lower() for pattern in RESTRICTED_PATTERNS):
-                return company
+        return _generate_sanitized(faker.company, 'Acme Corp')
                 
     @factory.post_generation
-    def set_password(self, create, extracted, **kwargs):
-        """Set secure password with proper hashing."""
+    def password(self, create, extracted, **kwargs):
+        """
+        Set the user's password.
+
+        Only an explicitly passed password is hashed, e.g.
+        UserFactory.create(password='real'); the declaration shares the
+        model field's name so that kwarg reaches this hook rather than the
+        column. Otherwise the user gets an unusable password unless
+        HASH_GENERATED_PASSWORDS is enabled.
+        """
         if not create:
             return
             
         if extracted:
             # Use provided password
             self.set_password(extracted)
+        elif not HASH_GENERATED_PASSWORDS:
+            # Skip hashing for tests that never authenticate
+            self.set_unusable_password()
         else:
             # Generate secure password
             password = faker.password(
@@ -105,12 +139,34 @@ class UserFactory(factory.django.DjangoModelFactory):
                 lower_case=True
             )
             self.set_password(password)
+
+    @classmethod
+    def create_batch_fast(cls, size, batch_size=500, **kwargs):
+        """
+        Create users with a single bulk INSERT and one shared password hash.
+
+        Skips per-instance save() and password hashing; use when tests only
+        need the rows to exist.
+
+        Args:
+            size (int): Number of users to create
+            batch_size (int): Rows per INSERT statement
+            **kwargs: Attribute overrides applied to every user
+
+        Returns:
+            list: Created user instances
+        """
+        users = cls.build_batch(size, **kwargs)
+        password = _bulk_password_hash()
+        for user in users:
+            user.password = password
+        return User.objects.bulk_create(users, batch_size=batch_size)
             
 class BuyerFactory(UserFactory):
     """Factory class for generating buyer user test instances."""
     
     role = 'buyer'
-    data_classification = DataClassification.SENSITIVE.value
+    data_classification = DataClassification.HIGHLY_SENSITIVE.value
     
     @classmethod
     def create_with_request(cls, request_data=None):
@@ -10,28 +10,31 @@ Tests cover:
 Version: 1.0.0
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.core.exceptions import ValidationError
 from users.models import User, USER_ROLES
+from users.tests import USER_SECURITY_SETTINGS
 from users.tests.factories import UserFactory, BuyerFactory, ArenaStaffFactory
 from core.constants import DataClassification
 
 # Test data constants
 VALID_TEST_EMAIL = "test@company.com"
 INVALID_TEST_EMAIL = "test@competitor.com"
-RESTRICTED_DOMAINS = ["competitor.com", "restricted.org"]
+INVALID_TEST_EMAILS = ["invalid-email", INVALID_TEST_EMAIL, "Test@RESTRICTED.ORG"]
 TEST_DATA_CLASSIFICATIONS = [
     DataClassification.HIGHLY_SENSITIVE.value,
     DataClassification.SENSITIVE.value,
     DataClassification.PUBLIC.value
 ]
 
+@override_settings(**USER_SECURITY_SETTINGS)
 class UserModelTests(TestCase):
     """Test cases for User model functionality including security and data classification."""
 
-    def setUp(self):
-        """Initialize test case with security configurations."""
-        self.valid_user_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Create data shared by all tests once per class."""
+        cls.valid_user_data = {
             'email': VALID_TEST_EMAIL,
             'full_name': 'Test User',
             'company': 'Test Company',
@@ -39,6 +42,17 @@ class UserModelTests(TestCase):
             'data_classification': DataClassification.HIGHLY_SENSITIVE.value
         }
 
+        # Variants of valid_user_data for tests that supply one field themselves
+        cls.user_data_sans_email = {k:v for k,v in cls.valid_user_data.items() if k != 'email'}
+        cls.user_data_sans_role = {k:v for k,v in cls.valid_user_data.items() if k != 'role'}
+        cls.user_data_sans_email_role = {
+            k:v for k,v in cls.user_data_sans_email.items() if k != 'role'
+        }
+
+        # Read-only users for tests that only inspect persisted users
+        cls.shared_buyer = BuyerFactory()
+        cls.shared_staff = ArenaStaffFactory()
+
     def test_create_user_basic(self):
         """Test basic user creation with required fields."""
         user = User.objects.create_user(**self.valid_user_data)
@@ -54,24 +68,20 @@ class UserModelTests(TestCase):
 
     def test_create_user_email_validation(self):
         """Test email validation and domain restrictions."""
-        # Test invalid email format
-        with self.assertRaises(ValidationError):
-            User.objects.create_user(
-                email="invalid-email",
-                **{k:v for k,v in self.valid_user_data.items() if k != 'email'}
-            )
-
-        # Test restricted domain
-        with self.assertRaises(ValidationError):
-            User.objects.create_user(
-                email="test@competitor.com",
-                **{k:v for k,v in self.valid_user_data.items() if k != 'email'}
-            )
-
-        # Test email normalization
+        # Validation runs before save, so rejected emails never reach the DB
+        for email in INVALID_TEST_EMAILS:
+            with self.subTest(email=email):
+                with self.assertRaises(ValidationError):
+                    User.objects.create_user(
+                        email=email,
+                        **self.user_data_sans_email
+                    )
+
+    def test_create_user_email_normalization(self):
+        """Test email normalization on user creation."""
         user = User.objects.create_user(
             email="Test.User@COMPANY.COM",
-            **{k:v for k,v in self.valid_user_data.items() if k != 'email'}
+            **self.user_data_sans_email
         )
         self.assertEqual(user.email, "test.user@company.com")
 
@@ -81,24 +91,40 @@ class UserModelTests(TestCase):
         with self.assertRaises(ValidationError):
             User.objects.create_user(
                 role="invalid_role",
-                **{k:v for k,v in self.valid_user_data.items() if k != 'role'}
+                **self.user_data_sans_role
             )
 
-        # Test buyer role creation
-        buyer = User.objects.create_buyer(
-            **{k:v for k,v in self.valid_user_data.items() if k != 'role'}
-        )
-        self.assertEqual(buyer.role, USER_ROLES['BUYER'])
-        self.assertFalse(buyer.is_staff)
-        self.assertTrue(buyer.is_buyer())
-
-        # Test staff role creation
-        staff = User.objects.create_staff(
-            **{k:v for k,v in self.valid_user_data.items() if k != 'role'}
-        )
-        self.assertEqual(staff.role, USER_ROLES['ARENA_STAFF'])
-        self.assertTrue(staff.is_staff)
-        self.assertTrue(staff.is_arena_staff())
+    def test_create_user_role_helpers(self):
+        """Test role-specific creation helpers."""
+        cases = [
+            (User.objects.create_buyer, USER_ROLES['BUYER'], False),
+            (User.objects.create_staff, USER_ROLES['ARENA_STAFF'], True),
+        ]
+        for create, role, is_staff in cases:
+            with self.subTest(role=role):
+                user = create(
+                    email=f"{role}@company.com",
+                    **self.user_data_sans_email_role
+                )
+                self.assertEqual(user.role, role)
+                self.assertEqual(user.is_staff, is_staff)
+                self.assertEqual(user.is_buyer(), not is_staff)
+                self.assertEqual(user.is_arena_staff(), is_staff)
+
+    def test_visible_for_role_filtering(self):
+        """Test role-based user visibility used by the admin queryset."""
+        buyer = self.shared_buyer
+        other_buyer = BuyerFactory()
+        staff = self.shared_staff
+        other_staff = ArenaStaffFactory()
+
+        # Buyers only see themselves
+        self.assertEqual(list(User.objects.visible_for(buyer)), [buyer])
+
+        # Staff see buyers and themselves but not other staff
+        visible = set(User.objects.visible_for(staff))
+        self.assertTrue({buyer, other_buyer, staff} <= visible)
+        self.assertNotIn(other_staff, visible)
 
     def test_data_classification_security(self):
         """Test data classification security controls."""
@@ -115,14 +141,14 @@ class UserModelTests(TestCase):
             user.save()
 
         # Test buyer classification requirements
-        buyer = BuyerFactory()
+        buyer = self.shared_buyer
         self.assertIn(
             buyer.data_classification,
             [DataClassification.HIGHLY_SENSITIVE.value, DataClassification.SENSITIVE.value]
         )
 
         # Test staff classification requirements
-        staff = ArenaStaffFactory()
+        staff = self.shared_staff
         self.assertEqual(
             staff.data_classification,
             DataClassification.HIGHLY_SENSITIVE.value
@@ -147,22 +173,27 @@ class UserModelTests(TestCase):
     def test_user_permissions(self):
         """Test user permission controls."""
         # Test buyer permissions
-        buyer = BuyerFactory()
+        buyer = self.shared_buyer
         self.assertFalse(buyer.is_staff)
         self.assertFalse(buyer.is_superuser)
         self.assertTrue(buyer.is_buyer())
         self.assertFalse(buyer.is_arena_staff())
 
         # Test staff permissions
-        staff = ArenaStaffFactory()
+        staff = self.shared_staff
         self.assertTrue(staff.is_staff)
         self.assertFalse(staff.is_superuser)
         self.assertFalse(staff.is_buyer())
         self.assertTrue(staff.is_arena_staff())
 
+
+@override_settings(**USER_SECURITY_SETTINGS)
+class UserModelPureTests(SimpleTestCase):
+    """Test cases for User model behaviour that needs no database access."""
+
     def test_user_model_methods(self):
         """Test User model utility methods."""
-        user = UserFactory(
+        user = UserFactory.build(
             email="test@company.com",
             full_name="Test User",
             company="Test Corp"
@@ -188,18 +219,18 @@ class UserModelTests(TestCase):
     def test_user_factory_generation(self):
         """Test user factory data generation."""
         # Test basic factory
-        user = UserFactory()
+        user = UserFactory.build()
         self.assertIsNotNone(user.email)
         self.assertIsNotNone(user.full_name)
         self.assertIsNotNone(user.company)
         self.assertTrue(user.is_active)
 
         # Test buyer factory
-        buyer = BuyerFactory()
+        buyer = BuyerFactory.build()
         self.assertEqual(buyer.role, USER_ROLES['BUYER'])
         self.assertFalse(buyer.is_staff)
 
         # Test staff factory
-        staff = ArenaStaffFactory()
+        staff = ArenaStaffFactory.build()
         self.assertEqual(staff.role, USER_ROLES['ARENA_STAFF'])
         self.assertTrue(staff.is_staff)
\ No newline at end of file
@@ -13,14 +13,14 @@ Version: 1.0.0
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from datetime import datetime, timedelta
 from freezegun import freeze_time
 from faker import Faker
+from django.test import override_settings
 
 from users.services import UserService
-from users.tests.factories import BuyerFactory, ArenaStaffFactory
-from notifications.email import EmailService
+from users.tests import USER_SECURITY_SETTINGS
 from core.constants import DataClassification
 from core.exceptions import AuthenticationError, SystemError
 from core.utils.encryption import encrypt_data
@@ -29,23 +29,67 @@ from core.utils.encryption import encrypt_data
 faker = Faker()
 faker.seed_instance(12345)
 
+# Upper bounds on queries per service call; catch N+1 regressions
+MAX_PROFILE_UPDATE_QUERIES = 3
+MAX_GOOGLE_AUTH_QUERIES = 6
+
+# Number of pre-generated profile payloads exercised by profile update tests
+PROFILE_PAYLOAD_COUNT = 3
+
+@pytest.fixture(scope='module')
+def profile_payloads():
+    """Generate seeded profile update payloads once per module."""
+    return [
+        {
+            "full_name": faker.name(),
+            "company": faker.company(),
+            "phone": faker.phone_number(),
+            "position": "CTO"
+        }
+        for _ in range(PROFILE_PAYLOAD_COUNT)
+    ]
+
+@pytest.fixture(autouse=True)
+def mock_tasks(monkeypatch):
+    """Stub Celery task dispatch for every test; attributes record each task's calls."""
+    tasks = Mock()
+    monkeypatch.setattr('users.services.send_magic_link_email.delay', tasks.send_magic_link_email)
+    monkeypatch.setattr('users.services.send_login_notification.delay', tasks.send_login_notification)
+    return tasks
+
+@pytest.fixture
+def mock_check_rate_limit(monkeypatch):
+    """Replace the service rate limit check."""
+    check = Mock()
+    monkeypatch.setattr(UserService, 'check_rate_limit', check)
+    return check
+
+@pytest.fixture
+def mock_verify_token(monkeypatch):
+    """Replace Google ID token verification."""
+    verify = Mock()
+    monkeypatch.setattr('google.oauth2.id_token.verify_oauth2_token', verify)
+    return verify
+
 class TestUserService:
     """Comprehensive test suite for UserService functionality."""
 
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, email_service, rate_limiter):
         """Set up test environment with mocks and fixtures."""
-        self.email_service = Mock(spec=EmailService)
-        self.rate_limiter = Mock()
+        self.email_service = email_service
+        self.rate_limiter = rate_limiter
         self.user_service = UserService(
             email_service=self.email_service,
             rate_limiter=self.rate_limiter
         )
         self.test_ip = "192.168.1.1"
 
-    @pytest.mark.django_db
-    @patch('notifications.email.EmailService.send_magic_link')
-    def test_create_magic_link_success(self, mock_send_magic_link):
+        # Scope security settings to each test instead of mutating globals
+        with override_settings(**USER_SECURITY_SETTINGS):
+            yield
+
+    def test_create_magic_link_success(self, mock_tasks):
         """Test successful magic link creation with business email."""
         # Arrange
         test_email = "user@company.com"
@@ -55,14 +99,12 @@ class TestUserService:
 
         # Assert
         assert result is True
-        mock_send_magic_link.assert_called_once()
-        call_args = mock_send_magic_link.call_args[1]
+        mock_tasks.send_magic_link_email.assert_called_once()
+        call_args = mock_tasks.send_magic_link_email.call_args[1]
         assert call_args['email'] == test_email
         assert 'magic_link_url' in call_args
         assert len(call_args['magic_link_url'].split('token=')[1]) > 0
 
-    @pytest.mark.django_db
-    @patch('users.services.UserService.check_rate_limit')
     def test_create_magic_link_rate_limit_exceeded(self, mock_check_rate_limit):
         """Test rate limiting for magic link creation."""
         # Arrange
@@ -78,7 +120,6 @@ class TestUserService:
         assert exc.value.code == "E1001"
         assert "Too many authentication attempts" in str(exc.value)
 
-    @pytest.mark.django_db
     def test_create_magic_link_invalid_email(self):
         """Test magic link creation with invalid email format."""
         # Arrange
@@ -92,7 +133,7 @@ class TestUserService:
 
     @pytest.mark.django_db
     @freeze_time("2023-01-01 12:00:00")
-    def test_verify_magic_link_success(self):
+    def test_verify_magic_link_success(self, mock_tasks):
         """Test successful magic link verification."""
         # Arrange
         test_email = "user@company.com"
@@ -109,12 +150,11 @@ class TestUserService:
         # Assert
         assert user.email == test_email
         assert user.last_login is not None
-        self.email_service.send_login_notification.assert_called_once_with(
+        mock_tasks.send_login_notification.assert_called_once_with(
             email=test_email,
             ip_address=self.test_ip
         )
 
-    @pytest.mark.django_db
     @freeze_time("2023-01-01 12:00:00")
     def test_verify_magic_link_expired(self):
         """Test expired magic link verification."""
@@ -134,8 +174,7 @@ class TestUserService:
         assert "Invalid or expired magic link" in str(exc.value)
 
     @pytest.mark.django_db
-    @patch('google.oauth2.id_token.verify_oauth2_token')
-    def test_authenticate_google_success(self, mock_verify_token):
+    def test_authenticate_google_success(self, mock_verify_token, django_assert_max_num_queries):
         """Test successful Google OAuth authentication."""
         # Arrange
         test_email = "user@company.com"
@@ -144,8 +183,9 @@ class TestUserService:
             "name": "Test User"
         }
 
-        # Act
-        user = self.user_service.authenticate_google("test_code", self.test_ip)
+        # Act - lookup, user insert and permission prefetches
+        with django_assert_max_num_queries(MAX_GOOGLE_AUTH_QUERIES):
+            user = self.user_service.authenticate_google("test_code", self.test_ip)
 
         # Assert
         assert user.email == test_email
@@ -153,19 +193,18 @@ class TestUserService:
         assert user.data_classification == DataClassification.HIGHLY_SENSITIVE.value
 
     @pytest.mark.django_db
-    def test_update_user_profile_success(self):
+    @pytest.mark.parametrize('payload_index', range(PROFILE_PAYLOAD_COUNT))
+    def test_update_user_profile_success(
+        self, buyer, profile_payloads, payload_index, django_assert_max_num_queries
+    ):
         """Test successful user profile update with encryption."""
         # Arrange
-        user = BuyerFactory.create()
-        profile_data = {
-            "full_name": faker.name(),
-            "company": faker.company(),
-            "phone": faker.phone_number(),
-            "position": "CTO"
-        }
+        user = buyer
+        profile_data = profile_payloads[payload_index]
 
-        # Act
-        updated_user = self.user_service.update_user_profile(user, profile_data)
+        # Act - a single UPDATE wrapped in its savepoint
+        with django_assert_max_num_queries(MAX_PROFILE_UPDATE_QUERIES):
+            updated_user = self.user_service.update_user_profile(user, profile_data)
 
         # Assert
         assert updated_user.full_name == profile_data["full_name"]
@@ -177,10 +216,10 @@ class TestUserService:
             assert decrypted == profile_data[field]
 
     @pytest.mark.django_db
-    def test_update_user_profile_invalid_fields(self):
+    def test_update_user_profile_invalid_fields(self, buyer):
         """Test profile update with invalid fields."""
         # Arrange
-        user = BuyerFactory.create()
+        user = buyer
         invalid_data = {
             "invalid_field": "test",
             "role": "admin"  # Attempt to change role
@@ -193,29 +232,30 @@ class TestUserService:
         assert "Invalid profile fields" in str(exc.value)
 
     @pytest.mark.django_db
-    def test_get_user_by_email_with_caching(self):
+    def test_get_user_by_email_with_caching(self, buyer, django_assert_num_queries):
         """Test user retrieval with caching."""
         # Arrange
-        user = BuyerFactory.create()
+        user = buyer
         cache_key = f"user:{user.email}"
 
-        # Act - First call should hit database
-        result1 = self.user_service.get_user_by_email(user.email)
+        # Act - First call should hit database: user row plus two prefetches
+        with django_assert_num_queries(3):
+            result1 = self.user_service.get_user_by_email(user.email)
         # Second call should hit cache
-        result2 = self.user_service.get_user_by_email(user.email)
+        with django_assert_num_queries(0):
+            result2 = self.user_service.get_user_by_email(user.email)
 
         # Assert
         assert result1 == user
         assert result2 == user
         cached_user = self.user_service._cache.get(cache_key)
-        assert cached_user == user
+        assert cached_user['id'] == user.id
+        assert cached_user['email'] == user.email
+        assert self.user_service._cache.get(f"user:id:{user.id}") == cached_user
 
-    @pytest.mark.django_db
-    def test_role_based_access_control(self):
+    def test_role_based_access_control(self, shared_buyer, shared_staff):
         """Test role-based access control for buyers and staff."""
-        # Arrange
-        buyer = BuyerFactory.create()
-        staff = ArenaStaffFactory.create()
+        buyer, staff = shared_buyer, shared_staff
 
         # Assert
         assert buyer.is_buyer()
@@ -227,10 +267,10 @@ class TestUserService:
         assert staff.is_staff
 
     @pytest.mark.django_db
-    def test_data_classification_enforcement(self):
+    def test_data_classification_enforcement(self, buyer):
         """Test data classification enforcement for user data."""
         # Arrange
-        user = BuyerFactory.create()
+        user = buyer
         
         # Act & Assert
         assert user.data_classification == DataClassification.HIGHLY_SENSITIVE.value
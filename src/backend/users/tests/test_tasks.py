@@ -0,0 +1,29 @@
+"""
+Test suite for the users app email delivery tasks.
+
+Tests cover:
+- Automatic retry of failed email deliveries
+
+Version: 1.0.0
+"""
+
+from unittest.mock import patch
+
+from core.exceptions import EmailError
+from users.tasks import MAX_RETRIES, send_login_notification
+
+class TestEmailTasks:
+    """Test cases for Celery email delivery tasks."""
+
+    def test_login_notification_retries_on_email_error(self):
+        """Test a failed delivery is retried up to MAX_RETRIES times."""
+        with patch('users.tasks.EmailService') as service_cls:
+            send = service_cls.return_value.send_login_notification
+            send.side_effect = EmailError("SES unreachable")
+
+            result = send_login_notification.apply(
+                kwargs={'email': 'buyer@company.com', 'ip_address': '203.0.113.7'}
+            )
+
+        assert result.failed()
+        assert send.call_count == MAX_RETRIES + 1
@@ -12,13 +12,14 @@ Version: 1.0.0
 """
 
 import logging
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any
 
 from vendors.models import Vendor
-from vendors.services import VendorService
+from vendors.services import VendorService, _VALIDATOR
 from core.constants import DataClassification
 from core.exceptions import RequestError, SystemError
-from core.utils.validators import validate_text_input, DataValidator
+from core.utils.validators import validate_text_input
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -29,24 +30,26 @@ VERSION = "1.0.0"
 # Security configuration
 DEFAULT_VENDOR_DATA_CLASSIFICATION = DataClassification.SENSITIVE.value
 VENDOR_SECURITY_LEVEL = "HIGH"
-
-# Initialize core services
-_vendor_service = VendorService()
-_validator = DataValidator(
-    classification_level=DataClassification.SENSITIVE,
-    custom_rules={
-        'website': _vendor_service._validate_website,
-        'capabilities': _vendor_service._validate_capabilities
-    }
-)
-
-def create_vendor(vendor_data: Dict[str, Any], classification: str = DEFAULT_VENDOR_DATA_CLASSIFICATION) -> Vendor:
+_VALID_CLASSIFICATIONS = frozenset(dc.value for dc in DataClassification)
+
+@lru_cache(maxsize=1)
+def _get_vendor_service() -> VendorService:
+    """Create the shared vendor service on first use."""
+    return VendorService()
+
+def create_vendor(
+    vendor_data: Dict[str, Any],
+    classification: str = DEFAULT_VENDOR_DATA_CLASSIFICATION,
+    actor: Optional[Any] = None
+) -> Vendor:
     """
     Create a new vendor with enhanced security and validation.
 
     Args:
         vendor_data: Dictionary containing vendor information
         classification: Data classification level for vendor data
+        actor: Identifier of the user performing the operation, used to
+            scope the rate limit
 
     Returns:
         Vendor: Newly created vendor instance
@@ -57,17 +60,17 @@ def create_vendor(vendor_data: Dict[str, Any], classification: str = DEFAULT_VEN
     """
     try:
         # Validate classification
-        if classification not in [dc.value for dc in DataClassification]:
+        if classification not in _VALID_CLASSIFICATIONS:
             raise RequestError(
                 "Invalid data classification",
                 code="E2001"
             )
 
         # Validate vendor data
-        _validator.validate(vendor_data)
+        _VALIDATOR.validate(vendor_data)
 
         # Create vendor with service
-        vendor = _vendor_service.create_vendor(vendor_data)
+        vendor = _get_vendor_service().create_vendor(vendor_data, actor=actor)
 
         logger.info(f"Created vendor {vendor.id} with classification {classification}")
         return vendor
@@ -78,39 +81,25 @@ def create_vendor(vendor_data: Dict[str, Any], classification: str = DEFAULT_VEN
         logger.error(f"Unexpected error creating vendor: {str(e)}")
         raise SystemError("Failed to create vendor") from e
 
-def match_vendors(requirements: Dict[str, Any], anonymous: bool = True) -> List[Dict[str, Any]]:
+def match_vendors(requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Match vendors to requirements with optional anonymization.
+    Match vendors to requirements, returning anonymized profiles.
 
     Args:
         requirements: Dictionary of buyer requirements
-        anonymous: Whether to return anonymized vendor data
 
     Returns:
-        List of matching vendor profiles (anonymized if requested)
+        List of anonymized matching vendor profiles
 
     Raises:
         RequestError: If requirements validation fails
         SystemError: If matching fails
     """
     try:
-        # Validate requirements
-        _validator.validate(requirements)
-
-        # Get matches using service
-        matches = _vendor_service.get_matches(requirements)
-
-        # Apply anonymization if requested
-        if anonymous:
-            matches = [
-                _vendor_service._anonymize_vendor(vendor)
-                for vendor in matches
-            ]
-
-        logger.info(
-            f"Found {len(matches)} matching vendors "
-            f"(anonymized={anonymous})"
-        )
+        # Service validates requirements and anonymizes results in bulk
+        matches = _get_vendor_service().get_matches(requirements)
+
+        logger.info(f"Found {len(matches)} matching vendors")
         return matches
 
     except (RequestError, SystemError):
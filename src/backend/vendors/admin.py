@@ -12,6 +12,7 @@ Version: 1.0.0
 
 import logging
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib import messages
 from django.utils.html import format_html
 from django_json_widget.widgets import JSONEditorWidget
@@ -22,6 +23,46 @@ from core.constants import DataClassification
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Badge colors by data classification
+CLASSIFICATION_COLORS = {
+    DataClassification.HIGHLY_SENSITIVE.value: 'red',
+    DataClassification.SENSITIVE.value: 'orange',
+    DataClassification.PUBLIC.value: 'green'
+}
+DEFAULT_BADGE_COLOR = 'gray'
+
+# Pre-rendered badges so changelist rows only do a dict lookup
+CLASSIFICATION_BADGES = {
+    classification: format_html(
+        '<span style="color: {};">{}</span>',
+        color,
+        classification
+    )
+    for classification, color in CLASSIFICATION_COLORS.items()
+}
+
+# Columns loaded for the changelist; capabilities and metadata JSON are deferred
+VENDOR_LIST_COLUMNS = [
+    'id',
+    'name',
+    'website',
+    'status',
+    'data_classification',
+    'last_verified_at',
+    'created_at',
+    'updated_at',
+    # Read by BaseModel.__init__; deferring them costs a query per row
+    'is_deleted',
+    'deleted_at'
+]
+
+class VendorChangeList(ChangeList):
+    """Changelist that only selects the columns rendered in list_display."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.only(*VENDOR_LIST_COLUMNS)
+
 @admin.register(Vendor)
 class VendorAdmin(admin.ModelAdmin):
     """
@@ -134,6 +175,10 @@ class VendorAdmin(admin.ModelAdmin):
             })
         )
 
+    def get_changelist(self, request, **kwargs):
+        """Use the column-restricted changelist."""
+        return VendorChangeList
+
     def formfield_for_dbfield(self, db_field, **kwargs):
         """
         Customize form fields with enhanced widgets and validation.
@@ -156,17 +201,14 @@ class VendorAdmin(admin.ModelAdmin):
         """
         Display data classification with color-coded badge.
         """
-        colors = {
-            DataClassification.HIGHLY_SENSITIVE.value: 'red',
-            DataClassification.SENSITIVE.value: 'orange',
-            DataClassification.PUBLIC.value: 'green'
-        }
-        
-        return format_html(
-            '<span style="color: {};">{}</span>',
-            colors.get(obj.data_classification, 'gray'),
-            obj.data_classification
-        )
+        badge = CLASSIFICATION_BADGES.get(obj.data_classification)
+        if badge is None:
+            badge = format_html(
+                '<span style="color: {};">{}</span>',
+                DEFAULT_BADGE_COLOR,
+                obj.data_classification
+            )
+        return badge
     data_classification_badge.short_description = 'Classification'
     data_classification_badge.admin_order_field = 'data_classification'
 
@@ -197,39 +239,24 @@ class VendorAdmin(admin.ModelAdmin):
 
     @admin.action(description="Activate selected vendors")
     def activate_vendors(self, request, queryset):
-        """Activate multiple vendors with validation."""
-        activated = 0
-        for vendor in queryset:
-            try:
-                vendor.activate()
-                activated += 1
-            except Exception as e:
-                messages.error(request, f"Error activating {vendor.name}: {str(e)}")
-                
+        """Activate eligible vendors in one batched update."""
+        activated, invalid = Vendor.bulk_activate(queryset)
+        for vendor in invalid:
+            messages.error(
+                request,
+                f"Error activating {vendor.name}: Required fields missing for activation"
+            )
+
         messages.success(request, f"Successfully activated {activated} vendors")
 
     @admin.action(description="Deactivate selected vendors")
     def deactivate_vendors(self, request, queryset):
-        """Deactivate multiple vendors."""
-        deactivated = 0
-        for vendor in queryset:
-            try:
-                vendor.deactivate("Bulk deactivation via admin")
-                deactivated += 1
-            except Exception as e:
-                messages.error(request, f"Error deactivating {vendor.name}: {str(e)}")
-                
+        """Deactivate eligible vendors in one batched update."""
+        deactivated = Vendor.bulk_deactivate(queryset, "Bulk deactivation via admin")
         messages.success(request, f"Successfully deactivated {deactivated} vendors")
 
     @admin.action(description="Archive selected vendors")
     def archive_vendors(self, request, queryset):
-        """Archive multiple vendors."""
-        archived = 0
-        for vendor in queryset:
-            try:
-                vendor.archive()
-                archived += 1
-            except Exception as e:
-                messages.error(request, f"Error archiving {vendor.name}: {str(e)}")
-                
-        messages.success(request, f"Successfully archived {archived} vendors")
\ No newline at end of file
+        """Archive eligible vendors in one batched update."""
+        archived = Vendor.bulk_archive(queryset)
+        messages.success(request, f"Successfully archived {archived} vendors")
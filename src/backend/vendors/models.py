@@ -11,9 +11,11 @@ This module implements:
 Version: 1.0.0
 """
 
-import json
 import logging
-from django.db import models
+from django.db import models, transaction
+from django.db.models.fields.json import KeyTransform
+from django.db.models.functions import Lower
+from django.contrib.postgres.indexes import GinIndex
 from django.utils import timezone
 from django.core.validators import URLValidator
 from django.core.exceptions import ValidationError
@@ -43,6 +45,28 @@ DEFAULT_DATA_CLASSIFICATION = DataClassification.SENSITIVE
 # Current version of capabilities schema
 CAPABILITIES_SCHEMA_VERSION = '1.0'
 
+def _empty_vendor_metadata():
+    """Return a fresh metadata skeleton with empty history lists."""
+    return {
+        'verification_history': []
+    }
+
+# Statuses each bulk transition may start from
+ACTIVATABLE_STATUSES = (PENDING, INACTIVE)
+DEACTIVATABLE_STATUSES = (PENDING, ACTIVE)
+ARCHIVABLE_STATUSES = (PENDING, ACTIVE, INACTIVE)
+
+# Shared website validator; URLValidator compiles a large regex on construction
+_URL_VALIDATOR = URLValidator()
+
+# Columns written by single and bulk status transitions
+STATUS_TRANSITION_FIELDS = ['status', 'last_verified_at', 'metadata', 'updated_at']
+
+# Columns written by capabilities updates
+CAPABILITIES_UPDATE_FIELDS = [
+    'capabilities', 'capabilities_version', 'last_verified_at', 'updated_at'
+]
+
 class Vendor(BaseModel):
     """
     Model representing a software vendor with enhanced security and validation.
@@ -63,7 +87,7 @@ class Vendor(BaseModel):
     )
     website = models.URLField(
         max_length=255,
-        validators=[URLValidator()],
+        validators=[_URL_VALIDATOR],
         help_text="Primary website URL"
     )
     description = models.TextField(
@@ -95,47 +119,39 @@ class Vendor(BaseModel):
         help_text="Schema version for capabilities"
     )
     metadata = models.JSONField(
-        default=dict,
+        default=_empty_vendor_metadata,
         help_text="Additional vendor metadata and history"
     )
 
+    # Vendor data is never public
+    data_classification = models.CharField(
+        max_length=20,
+        choices=[(dc.value, dc.name) for dc in DataClassification],
+        default=DEFAULT_DATA_CLASSIFICATION.value,
+        db_index=True
+    )
+
     class Meta:
         ordering = ['name']
         indexes = [
             models.Index(fields=['status', 'created_at']),
-            models.Index(fields=['last_verified_at'])
+            models.Index(fields=['last_verified_at']),
+            # Containment lookups on capabilities
+            GinIndex(fields=['capabilities'], name='vendor_caps_gin', opclasses=['jsonb_path_ops']),
+            # Range lookups on implementation time
+            models.Index(
+                KeyTransform('implementation_time', 'capabilities'),
+                name='vendor_caps_impl_time_idx'
+            )
+        ]
+        constraints = [
+            # Functional unique indexes back case-insensitive duplicate checks
+            models.UniqueConstraint(Lower('name'), name='vendor_name_ci_uniq'),
+            models.UniqueConstraint(Lower('website'), name='vendor_website_ci_uniq')
         ]
         verbose_name = 'Vendor'
         verbose_name_plural = 'Vendors'
 
-    def __init__(self, *args, **kwargs):
-        """Initialize vendor model with required fields and validation."""
-        super().__init__(*args, **kwargs)
-        
-        # Set default data classification
-        if not self.data_classification:
-            self.data_classification = DEFAULT_DATA_CLASSIFICATION.value
-            
-        # Initialize status if new instance
-        if not self.pk and not self.status:
-            self.status = PENDING
-            
-        # Initialize empty capabilities if needed
-        if not self.capabilities:
-            self.capabilities = {}
-            
-        # Set capabilities version
-        if not self.capabilities_version:
-            self.capabilities_version = CAPABILITIES_SCHEMA_VERSION
-            
-        # Initialize metadata
-        if not self.metadata:
-            self.metadata = {
-                'status_history': [],
-                'verification_history': [],
-                'capabilities_history': []
-            }
-
     def validate_model_specific_classification(self, classification):
         """
         Implement vendor-specific data classification rules.
@@ -170,35 +186,63 @@ class Vendor(BaseModel):
         Raises:
             ValidationError: If validation fails
         """
+        # Only validate fields that this save writes
+        update_fields = kwargs.get('update_fields')
+
+        def saving(*fields):
+            return update_fields is None or any(
+                field in update_fields for field in fields
+            )
+
         # Validate vendor name
-        if len(self.name.strip()) < 2:
+        if saving('name') and len(self.name.strip()) < 2:
             raise ValidationError("Vendor name must be at least 2 characters")
             
         # Validate website URL
-        try:
-            URLValidator()(self.website)
-        except ValidationError as e:
-            raise ValidationError(f"Invalid website URL: {e}")
+        if saving('website'):
+            try:
+                _URL_VALIDATOR(self.website)
+            except ValidationError as e:
+                raise ValidationError(f"Invalid website URL: {e}")
             
         # Validate capabilities schema
-        if self.capabilities and self.capabilities_version != CAPABILITIES_SCHEMA_VERSION:
+        if (
+            saving('capabilities', 'capabilities_version')
+            and self.capabilities
+            and self.capabilities_version != CAPABILITIES_SCHEMA_VERSION
+        ):
             raise ValidationError(
                 f"Invalid capabilities schema version: {self.capabilities_version}"
             )
             
         # Update verification timestamp if activating
-        if self.status == ACTIVE and self.tracker.has_changed('status'):
+        previous_status = self.__dict__.get('_loaded_status')
+        status_changed = saving('status') and (
+            self._state.adding or previous_status != self.status
+        )
+        if self.status == ACTIVE and status_changed:
             self.last_verified_at = timezone.now()
-            
-        # Track status changes
-        if self.tracker.has_changed('status'):
-            self.metadata['status_history'].append({
-                'from': self.tracker.previous('status'),
-                'to': self.status,
-                'timestamp': timezone.now().isoformat(),
-            })
-            
-        return super().save(*args, **kwargs)
+
+        # Status changes go to the append-only history table
+        with transaction.atomic():
+            result = super().save(*args, **kwargs)
+            if status_changed:
+                VendorStatusChange.objects.create(
+                    vendor=self,
+                    from_status=previous_status,
+                    to_status=self.status
+                )
+        if saving('status'):
+            self._loaded_status = self.status
+        return result
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the persisted status so save() can detect transitions."""
+        instance = super().from_db(db, field_names, values)
+        if 'status' in instance.__dict__:
+            instance._loaded_status = instance.status
+        return instance
 
     def activate(self):
         """
@@ -214,10 +258,9 @@ class Vendor(BaseModel):
         self.last_verified_at = timezone.now()
         
         # Log activation
-        logger.info(f"Activating vendor {self.pk}: {self.name}")
+        logger.info("Activating vendor %s: %s", self.pk, self.name)
         
-        self.save()
-        return True
+        return self._commit_transition(STATUS_TRANSITION_FIELDS)
 
     def deactivate(self, reason):
         """
@@ -234,10 +277,9 @@ class Vendor(BaseModel):
         self.metadata['deactivated_at'] = timezone.now().isoformat()
         
         # Log deactivation
-        logger.info(f"Deactivating vendor {self.pk}: {self.name} - {reason}")
+        logger.info("Deactivating vendor %s: %s - %s", self.pk, self.name, reason)
         
-        self.save()
-        return True
+        return self._commit_transition(STATUS_TRANSITION_FIELDS)
 
     def archive(self):
         """
@@ -259,11 +301,167 @@ class Vendor(BaseModel):
         }
         
         # Log archival
-        logger.info(f"Archiving vendor {self.pk}: {self.name}")
+        logger.info("Archiving vendor %s: %s", self.pk, self.name)
         
-        self.save()
+        return self._commit_transition(STATUS_TRANSITION_FIELDS)
+
+    def _commit_transition(self, update_fields, related=()):
+        """
+        Persist a transition, or queue it while _apply_transitions batches.
+
+        Args:
+            update_fields (list): Vendor columns the transition changed
+            related (list): Unsaved history rows to write with the vendor
+
+        Returns:
+            bool: Success status
+        """
+        pending = getattr(self, '_pending_transition', None)
+        if pending is not None:
+            pending['update_fields'].update(update_fields)
+            pending['related'].extend(related)
+            return True
+
+        with transaction.atomic():
+            self.save(update_fields=list(update_fields))
+            for row in related:
+                row.save()
         return True
 
+    def _apply_transitions(self, *operations):
+        """
+        Run several transition methods and persist them with a single save.
+
+        Nothing is written if any operation fails. Status history records
+        the net change across the batch.
+
+        Args:
+            *operations: Tuples of a transition method name and its arguments,
+                e.g. ('activate',), ('update_capabilities', capabilities)
+
+        Returns:
+            bool: Success status
+        """
+        self._pending_transition = {'update_fields': set(), 'related': []}
+        try:
+            for name, *args in operations:
+                getattr(self, name)(*args)
+            pending = self._pending_transition
+        finally:
+            self._pending_transition = None
+
+        return self._commit_transition(
+            sorted(pending['update_fields']), pending['related']
+        )
+
+    def _record_transition(self, status, now):
+        """
+        Apply a status change without saving.
+
+        Returns:
+            VendorStatusChange: Unsaved history row for the transition
+        """
+        change = VendorStatusChange(
+            vendor=self,
+            from_status=self.status,
+            to_status=status,
+            changed_at=now
+        )
+        self.status = status
+        self._loaded_status = status
+        self.updated_at = now
+        return change
+
+    @classmethod
+    def bulk_activate(cls, queryset):
+        """
+        Activate eligible vendors with a single batched UPDATE.
+
+        Only pending and inactive vendors are considered. Vendors missing
+        fields required for activation are skipped and returned.
+
+        Args:
+            queryset (QuerySet): Vendors to activate
+
+        Returns:
+            tuple: Number of activated vendors and list of skipped vendors
+        """
+        now = timezone.now()
+        activated, invalid, changes = [], [], []
+        for vendor in queryset.filter(status__in=ACTIVATABLE_STATUSES):
+            if not all([vendor.name, vendor.website, vendor.capabilities]):
+                invalid.append(vendor)
+                continue
+            changes.append(vendor._record_transition(ACTIVE, now))
+            vendor.last_verified_at = now
+            activated.append(vendor)
+
+        with transaction.atomic():
+            cls.objects.bulk_update(activated, STATUS_TRANSITION_FIELDS)
+            VendorStatusChange.objects.bulk_create(changes)
+        logger.info("Bulk activated vendors: %s", [vendor.pk for vendor in activated])
+        return len(activated), invalid
+
+    @classmethod
+    def bulk_deactivate(cls, queryset, reason):
+        """
+        Deactivate pending and active vendors with a single batched UPDATE.
+
+        Args:
+            queryset (QuerySet): Vendors to deactivate
+            reason (str): Reason for deactivation
+
+        Returns:
+            int: Number of deactivated vendors
+        """
+        now = timezone.now()
+        deactivated = list(queryset.filter(status__in=DEACTIVATABLE_STATUSES))
+        changes = []
+        for vendor in deactivated:
+            changes.append(vendor._record_transition(INACTIVE, now))
+            vendor.metadata['deactivation_reason'] = reason
+            vendor.metadata['deactivated_at'] = now.isoformat()
+
+        with transaction.atomic():
+            cls.objects.bulk_update(deactivated, STATUS_TRANSITION_FIELDS)
+            VendorStatusChange.objects.bulk_create(changes)
+        logger.info(
+            "Bulk deactivated vendors: %s - %s",
+            [vendor.pk for vendor in deactivated], reason
+        )
+        return len(deactivated)
+
+    @classmethod
+    def bulk_archive(cls, queryset):
+        """
+        Archive non-archived vendors with a single batched UPDATE.
+
+        Args:
+            queryset (QuerySet): Vendors to archive
+
+        Returns:
+            int: Number of archived vendors
+        """
+        now = timezone.now()
+        archived = list(queryset.filter(status__in=ARCHIVABLE_STATUSES))
+        changes = []
+        for vendor in archived:
+            changes.append(vendor._record_transition(ARCHIVED, now))
+            vendor.metadata['archived_at'] = now.isoformat()
+            vendor.metadata['archive_snapshot'] = {
+                'name': vendor.name,
+                'website': vendor.website,
+                'description': vendor.description,
+                'capabilities': vendor.capabilities,
+                'archived_at': now.isoformat()
+            }
+
+        with transaction.atomic():
+            cls.objects.bulk_update(archived, STATUS_TRANSITION_FIELDS)
+            VendorStatusChange.objects.bulk_create(changes)
+        logger.info("Bulk archived vendors: %s", [vendor.pk for vendor in archived])
+        return len(archived)
+
     def update_capabilities(self, capabilities):
         """
         Update vendor capabilities with validation.
@@ -281,11 +479,12 @@ class Vendor(BaseModel):
         if not isinstance(capabilities, dict):
             raise ValidationError("Capabilities must be a dictionary")
             
-        # Store previous version in history
-        self.metadata['capabilities_history'].append({
-            'previous': self.capabilities,
-            'timestamp': timezone.now().isoformat()
-        })
+        # Store previous version as a revision row
+        revision = VendorCapabilitiesRevision(
+            vendor=self,
+            capabilities=self.capabilities,
+            capabilities_version=self.capabilities_version
+        )
         
         # Update capabilities
         self.capabilities = capabilities
@@ -293,7 +492,84 @@ class Vendor(BaseModel):
         self.last_verified_at = timezone.now()
         
         # Log update
-        logger.info(f"Updating capabilities for vendor {self.pk}: {self.name}")
+        logger.info("Updating capabilities for vendor %s: %s", self.pk, self.name)
         
-        self.save()
-        return True
\ No newline at end of file
+        return self._commit_transition(CAPABILITIES_UPDATE_FIELDS, [revision])
+
+
+class VendorStatusChange(models.Model):
+    """
+    Append-only record of a vendor status transition.
+
+    Kept out of Vendor.metadata so the vendor row does not grow with every
+    transition and history can be queried through an index.
+    """
+
+    vendor = models.ForeignKey(
+        Vendor,
+        on_delete=models.CASCADE,
+        related_name='status_changes',
+        help_text="Vendor whose status changed"
+    )
+    from_status = models.CharField(
+        max_length=20,
+        choices=VENDOR_STATUS_CHOICES,
+        null=True,
+        blank=True,
+        help_text="Status before the transition, empty on creation"
+    )
+    to_status = models.CharField(
+        max_length=20,
+        choices=VENDOR_STATUS_CHOICES,
+        help_text="Status after the transition"
+    )
+    changed_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="When the transition happened"
+    )
+
+    class Meta:
+        ordering = ['changed_at', 'id']
+        indexes = [
+            models.Index(fields=['vendor', 'changed_at'])
+        ]
+        verbose_name = 'Vendor Status Change'
+        verbose_name_plural = 'Vendor Status Changes'
+
+
+class VendorCapabilitiesRevision(models.Model):
+    """
+    Append-only snapshot of capabilities replaced by a vendor update.
+
+    Kept out of Vendor.metadata so history does not embed every previous
+    capabilities blob in the vendor row.
+    """
+
+    vendor = models.ForeignKey(
+        Vendor,
+        on_delete=models.CASCADE,
+        related_name='capabilities_revisions',
+        help_text="Vendor whose capabilities were replaced"
+    )
+    capabilities = models.JSONField(
+        default=dict,
+        help_text="Capabilities data before the update"
+    )
+    capabilities_version = models.CharField(
+        max_length=10,
+        default=CAPABILITIES_SCHEMA_VERSION,
+        help_text="Schema version of the replaced capabilities"
+    )
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="When the capabilities were replaced"
+    )
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        get_latest_by = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['vendor', '-created_at'])
+        ]
+        verbose_name = 'Vendor Capabilities Revision'
+        verbose_name_plural = 'Vendor Capabilities Revisions'
@@ -11,9 +11,12 @@ This module implements:
 Version: 1.0.0
 """
 
+import hashlib
+import json
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.core.cache import cache
 
@@ -34,8 +37,35 @@ REQUIRED_CAPABILITIES = [
     'security_certifications',
     'support_levels'
 ]
+REQUIRED_CAPABILITIES_SET = frozenset(REQUIRED_CAPABILITIES)
+# Requirement keys matched by jsonb containment against capabilities
+CONTAINMENT_REQUIREMENTS = ('product_type', 'security_certifications')
+# Containment keys whose capability values are arrays
+ARRAY_REQUIREMENTS = ('security_certifications',)
+# Requirement keys compared numerically against capabilities
+NUMERIC_REQUIREMENTS = ('implementation_time',)
+# Requirement keys that shape the match query and so participate in its cache key
+MATCH_KEY_REQUIREMENTS = CONTAINMENT_REQUIREMENTS + NUMERIC_REQUIREMENTS
 VENDOR_CACHE_TIMEOUT = CACHE_TIMEOUTS['VENDOR_LIST']
 RATE_LIMIT_OPERATIONS = '100/hour'
+RATE_LIMIT_MAX_OPERATIONS = 100
+RATE_LIMIT_WINDOW = 3600
+
+def _hashable(value: Any) -> Any:
+    """Convert list and dict requirement values into hashable equivalents."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    return value
+
+@lru_cache(maxsize=1024)
+def _cache_key_for(items: tuple) -> str:
+    """Digest sorted requirement items into a match cache key."""
+    payload = json.dumps(
+        dict(items), sort_keys=True, separators=(',', ':'), default=str
+    ).encode()
+    return f"vendor_matches:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
 
 class VendorService:
     """
@@ -50,93 +80,92 @@ class VendorService:
     """
 
     def __init__(self) -> None:
-        """Initialize vendor service with security components."""
-        self._validator = DataValidator(
-            classification_level=DataClassification.SENSITIVE,
-            custom_rules={
-                'website': self._validate_website,
-                'capabilities': self._validate_capabilities
-            }
-        )
+        """Initialize vendor service with its cache backend."""
         self._cache_manager = cache
 
-    def create_vendor(self, vendor_data: Dict[str, Any]) -> Vendor:
+    def create_vendor(self, vendor_data: Dict[str, Any], actor: Optional[Any] = None) -> Vendor:
         """
         Create a new vendor profile with enhanced validation and security.
 
         Args:
             vendor_data: Dictionary containing vendor information
+            actor: Identifier of the user performing the operation, used to
+                scope the rate limit
 
         Returns:
             Created vendor instance with sanitized data
 
         Raises:
-            RequestError: If validation fails
+            RequestError: If validation fails or the rate limit is exceeded
             SystemError: If creation fails
         """
         try:
             # Validate vendor data
-            self._validator.validate(vendor_data)
+            _VALIDATOR.validate(vendor_data)
 
-            # Sanitize text inputs
-            vendor_data['name'] = validate_text_input(
+            # Validate text inputs; vendor_data itself is left unmodified
+            validate_text_input(
                 vendor_data.get('name', ''),
                 max_length=255,
                 required=True
             )
-            vendor_data['website'] = validate_text_input(
+            validate_text_input(
                 vendor_data.get('website', ''),
                 max_length=255,
                 required=True
             )
-            vendor_data['description'] = validate_text_input(
+            validate_text_input(
                 vendor_data.get('description', ''),
                 max_length=1000,
                 required=True
             )
 
-            # Check for duplicate vendor
-            if Vendor.objects.filter(
-                Q(name__iexact=vendor_data['name']) |
-                Q(website__iexact=vendor_data['website'])
-            ).exists():
-                raise RequestError(
-                    "Vendor with this name or website already exists",
-                    code="E2001"
-                )
-
             # Validate required capabilities
             capabilities = vendor_data.get('capabilities', {})
-            missing_capabilities = [
-                cap for cap in REQUIRED_CAPABILITIES 
-                if cap not in capabilities
-            ]
+            missing_capabilities = REQUIRED_CAPABILITIES_SET.difference(capabilities)
             if missing_capabilities:
                 raise RequestError(
-                    f"Missing required capabilities: {', '.join(missing_capabilities)}",
+                    f"Missing required capabilities: {', '.join(sorted(missing_capabilities))}",
                     code="E2002"
                 )
 
-            # Create vendor within transaction
-            with transaction.atomic():
-                vendor = Vendor.objects.create(
-                    name=vendor_data['name'],
-                    website=vendor_data['website'],
-                    description=vendor_data['description'],
-                    capabilities=capabilities,
-                    status='pending'  # Default status
+            # Enforce the per-actor rate limit; only successful creates count,
+            # so concurrent requests may overshoot the limit slightly
+            if self._rate_limit_counter(actor) >= RATE_LIMIT_MAX_OPERATIONS:
+                raise RequestError(
+                    "Vendor operation rate limit exceeded",
+                    code="E2004"
+                )
+
+            # Create vendor within transaction; the case-insensitive unique
+            # constraints on name and website reject duplicates
+            try:
+                with transaction.atomic():
+                    vendor = Vendor.objects.create(
+                        name=vendor_data['name'],
+                        website=vendor_data['website'],
+                        description=vendor_data['description'],
+                        capabilities=capabilities,
+                        status='pending'  # Default status
+                    )
+            except IntegrityError:
+                raise RequestError(
+                    "Vendor with this name or website already exists",
+                    code="E2001"
                 )
 
-                # Cache new vendor data
-                self._cache_vendor(vendor)
+            self._record_operation(actor)
+
+            # Cache new vendor data
+            self._cache_vendor(vendor)
 
-                logger.info(f"Created new vendor: {vendor.id}")
-                return vendor
+            logger.info("Created new vendor: %s", vendor.id)
+            return vendor
 
         except RequestError:
             raise
         except Exception as e:
-            logger.error(f"Failed to create vendor: {str(e)}")
+            logger.error("Failed to create vendor: %s", e)
             raise SystemError("Failed to create vendor profile") from e
 
     def get_matches(self, requirements: Dict[str, Any]) -> List[Vendor]:
@@ -155,9 +184,10 @@ class VendorService:
         """
         try:
             # Validate requirements
-            self._validator.validate(requirements)
+            _VALIDATOR.validate(requirements)
 
             # Check cache first
+            requirements = self._normalize_requirements(requirements)
             cache_key = self._get_cache_key(requirements)
             cached_results = self._cache_manager.get(cache_key)
             if cached_results is not None:
@@ -166,28 +196,31 @@ class VendorService:
             # Build query filters
             filters = Q(status='active')
             
-            # Match capabilities
-            if 'product_type' in requirements:
-                filters &= Q(capabilities__product_type=requirements['product_type'])
+            # Equality and membership terms become one jsonb containment
+            # lookup so Postgres can use the GIN index on capabilities
+            contained = {
+                key: requirements[key]
+                for key in CONTAINMENT_REQUIREMENTS
+                if key in requirements
+            }
+            if contained:
+                filters &= Q(capabilities__contains=contained)
             
+            # Range predicate is served by the implementation_time expression index
             if 'implementation_time' in requirements:
                 filters &= Q(
                     capabilities__implementation_time__lte=
                     requirements['implementation_time']
                 )
 
-            if 'security_certifications' in requirements:
-                filters &= Q(
-                    capabilities__security_certifications__contains=
-                    requirements['security_certifications']
-                )
-
-            # Get matching vendors
-            vendors = Vendor.objects.filter(filters)[:MAX_VENDORS_PER_REQUEST]
+            # Get matching vendors as plain rows of the columns _anonymize_vendor reads
+            rows = Vendor.objects.filter(filters).values(
+                'id', 'capabilities'
+            )[:MAX_VENDORS_PER_REQUEST]
 
             # Anonymize vendor data
             anonymized_vendors = [
-                self._anonymize_vendor(vendor) for vendor in vendors
+                self._anonymize_vendor(row) for row in rows
             ]
 
             # Cache results
@@ -197,16 +230,40 @@ class VendorService:
                 timeout=VENDOR_CACHE_TIMEOUT
             )
 
-            logger.info(f"Found {len(anonymized_vendors)} matching vendors")
+            logger.info("Found %d matching vendors", len(anonymized_vendors))
             return anonymized_vendors
 
         except RequestError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get matching vendors: {str(e)}")
+            logger.error("Failed to get matching vendors: %s", e)
             raise SystemError("Failed to process vendor matching") from e
 
-    def _validate_website(self, website: str) -> bool:
+    def _rate_limit_counter(self, actor: Optional[Any] = None) -> int:
+        """
+        Read the actor's vendor operation count for the current window.
+
+        Args:
+            actor: Identifier of the user performing the operation
+
+        Returns:
+            int: Number of operations the actor made in the window
+        """
+        return self._cache_manager.get(self._rate_limit_key(actor), 0)
+
+    def _record_operation(self, actor: Optional[Any] = None) -> None:
+        """Count a completed vendor operation against the actor's window."""
+        rate_key = self._rate_limit_key(actor)
+        self._cache_manager.add(rate_key, 0, timeout=RATE_LIMIT_WINDOW)
+        self._cache_manager.incr(rate_key)
+
+    @staticmethod
+    def _rate_limit_key(actor: Optional[Any] = None) -> str:
+        """Cache key of the actor's operation counter."""
+        return f"vendor_operations:{actor}" if actor is not None else "vendor_operations"
+
+    @staticmethod
+    def _validate_website(website: str) -> bool:
         """Validate vendor website format and accessibility."""
         try:
             return bool(validate_text_input(
@@ -218,41 +275,97 @@ class VendorService:
         except Exception:
             return False
 
-    def _validate_capabilities(self, capabilities: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _validate_capabilities(capabilities: Dict[str, Any]) -> bool:
         """Validate vendor capabilities against required schema."""
         if not isinstance(capabilities, dict):
             return False
             
-        return all(cap in capabilities for cap in REQUIRED_CAPABILITIES)
+        return REQUIRED_CAPABILITIES_SET.issubset(capabilities)
 
     def _cache_vendor(self, vendor: Vendor) -> None:
-        """Cache vendor data with timeout."""
+        """
+        Cache the anonymized vendor view with timeout.
+
+        Stores a plain dict rather than the model instance so the cached
+        payload excludes description, metadata and encrypted fields.
+        """
         cache_key = f"vendor:{vendor.id}"
         self._cache_manager.set(
             cache_key,
-            vendor,
+            self._anonymize_vendor(
+                {'id': vendor.id, 'capabilities': vendor.capabilities}
+            ),
             timeout=VENDOR_CACHE_TIMEOUT
         )
 
+    @staticmethod
+    def _normalize_requirements(requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce requirements to the canonical form used for querying and caching.
+
+        Keeps only MATCH_KEY_REQUIREMENTS, coerces NUMERIC_REQUIREMENTS to
+        int/float where possible, wraps scalar ARRAY_REQUIREMENTS values in a
+        list (jsonb containment never matches a scalar against an array) and
+        sorts list values, so equivalent requests share a cache entry. Strings
+        keep their case because jsonb containment is case-sensitive.
+        """
+        normalized = {}
+        for key in MATCH_KEY_REQUIREMENTS:
+            if key not in requirements:
+                continue
+            value = requirements[key]
+            if key in NUMERIC_REQUIREMENTS and isinstance(value, str):
+                try:
+                    value = float(value) if '.' in value else int(value)
+                except ValueError:
+                    pass
+            elif key in ARRAY_REQUIREMENTS and not isinstance(value, (list, tuple)):
+                value = [value]
+            elif isinstance(value, (list, tuple)):
+                value = sorted(value, key=str)
+            normalized[key] = value
+        return normalized
+
     def _get_cache_key(self, requirements: Dict[str, Any]) -> str:
-        """Generate cache key for vendor matching results."""
-        # Sort requirements for consistent cache keys
-        sorted_req = sorted(
-            (k, str(v)) for k, v in requirements.items()
+        """
+        Generate cache key for vendor matching results.
+
+        Expects normalized requirements and digests their canonical JSON so
+        every worker process derives the same key; the built-in hash() is
+        salted per process.
+        """
+        return _cache_key_for(
+            tuple(sorted((key, _hashable(value)) for key, value in requirements.items()))
         )
-        return f"vendor_matches:{hash(tuple(sorted_req))}"
 
-    def _anonymize_vendor(self, vendor: Vendor) -> Dict[str, Any]:
+    def _anonymize_vendor(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create anonymized version of vendor data for secure evaluation.
         
         Removes identifying information while preserving essential details.
+
+        Args:
+            row: Vendor values with at least 'id' and 'capabilities'
         """
+        capabilities = row['capabilities']
         return {
-            'id': vendor.id,
-            'capabilities': vendor.capabilities,
-            'implementation_time': vendor.capabilities.get('implementation_time'),
-            'security_certifications': vendor.capabilities.get('security_certifications'),
-            'support_levels': vendor.capabilities.get('support_levels'),
+            'id': row['id'],
+            'capabilities': capabilities,
+            'implementation_time': capabilities.get('implementation_time'),
+            'security_certifications': capabilities.get('security_certifications'),
+            'support_levels': capabilities.get('support_levels'),
             # Exclude name, website, and other identifying info
-        }
\ No newline at end of file
+        }
+
+
+# Shared validator; its rules are stateless so one instance serves every call.
+# Its _performance_metrics counters are bumped without a lock and are only
+# approximate under concurrent requests.
+_VALIDATOR = DataValidator(
+    classification_level=DataClassification.SENSITIVE,
+    custom_rules={
+        'website': VendorService._validate_website,
+        'capabilities': VendorService._validate_capabilities
+    }
+)
@@ -0,0 +1,56 @@
+"""
+Shared pytest fixtures for the vendors app test suite.
+
+The vendor corpus is created once per test class outside the per-test
+transaction and removed when the class finishes; tests must only read it.
+
+Version: 1.0.0
+"""
+
+import pytest
+from vendors.models import Vendor
+from vendors.tests.factories import VendorFactory
+
+# Vendors in the shared matching corpus
+VENDOR_CORPUS_SIZE = 100
+
+class DictCache:
+    """
+    In-process stand-in for Django's cache covering the calls VendorService
+    makes. Timeouts are recorded but never expire entries.
+    """
+
+    def __init__(self):
+        self.store = {}
+        self.timeouts = {}
+
+    def get(self, key, default=None):
+        return self.store.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.store[key] = value
+        self.timeouts[key] = timeout
+
+    def add(self, key, value, timeout=None):
+        if key in self.store:
+            return False
+        self.set(key, value, timeout)
+        return True
+
+    def incr(self, key, delta=1):
+        self.store[key] += delta
+        return self.store[key]
+
+@pytest.fixture
+def dict_cache():
+    """Fresh dict-backed cache for exercising real cache hits."""
+    return DictCache()
+
+@pytest.fixture(scope='class')
+def vendor_corpus(django_db_setup, django_db_blocker):
+    """Read-only vendor corpus shared by the tests of one class."""
+    with django_db_blocker.unblock():
+        vendors = VendorFactory.create_bulk(VENDOR_CORPUS_SIZE, with_caps=True)
+    yield vendors
+    with django_db_blocker.unblock():
+        Vendor.objects.filter(pk__in=[vendor.pk for vendor in vendors]).delete()
@@ -10,16 +10,46 @@ This module implements:
 Version: 1.0.0
 """
 
-import json
+import random
+import uuid
 import factory
+from django.db import IntegrityError, transaction
+from django.db.models.signals import post_save, pre_save
+from django.utils import timezone
 from faker import Faker
 from core.constants import DataClassification
-from vendors.models import Vendor, VENDOR_STATUS_CHOICES, PENDING
+from vendors.models import Vendor, VendorStatusChange, VENDOR_STATUS_CHOICES, PENDING
 
 # Configure Faker for consistent test data
 faker = Faker()
 faker.seed_instance(12345)
 
+# Seeded sampler for capability values drawn from the fixed pools below
+_rng = random.Random(12345)
+
+# Capability value pools
+_TECHS = (
+    "Python", "Java", "JavaScript", "React", "Node.js",
+    "AWS", "Azure", "Docker", "Kubernetes"
+)
+_INDUSTRIES = (
+    "Technology", "Finance", "Healthcare", "Manufacturing",
+    "Retail", "Education", "Government"
+)
+_SIZES = ("1-50", "51-200", "201-1000", "1001-5000", "5000+")
+_FEATURES = (
+    "API Integration", "Single Sign-On", "Custom Reporting",
+    "Mobile Support", "Data Analytics", "Workflow Automation"
+)
+_IMPL_TIMES = ("1-2 weeks", "2-4 weeks", "1-2 months", "3+ months")
+_PRICING_TIERS = ("Basic", "Professional", "Enterprise")
+
+# Attempts at creating a vendor before a name collision is re-raised
+MAX_CREATE_ATTEMPTS = 5
+
+# Rows per INSERT statement when seeding vendors in bulk
+BULK_CREATE_BATCH_SIZE = 500
+
 # Default capabilities structure
 DEFAULT_CAPABILITIES = {
     "technologies": [],
@@ -30,6 +60,29 @@ DEFAULT_CAPABILITIES = {
     "implementation_time": ""
 }
 
+def _sample_capabilities():
+    """Realistic capabilities payload sampled from the pools above."""
+    return {
+        "technologies": _rng.choices(_TECHS, k=3),
+        "industries": _rng.choices(_INDUSTRIES, k=2),
+        "company_size": _rng.choices(_SIZES, k=2),
+        "features": _rng.choices(_FEATURES, k=4),
+        "pricing_tiers": [
+            {
+                "name": tier,
+                "price": f"${_rng.randint(100, 1000)}/month",
+                "features": [faker.bs() for _ in range(3)]
+            } for tier in _PRICING_TIERS
+        ],
+        "implementation_time": _rng.choice(_IMPL_TIMES)
+    }
+
+def _unique_identity():
+    """Suffixed company name and matching website for collision retries."""
+    name = f"{faker.company()} {uuid.uuid4().hex[:6]}"
+    return name, f"https://www.{name.lower().replace(' ', '')}.com"
+
+@factory.django.mute_signals(pre_save, post_save)
 class VendorFactory(factory.django.DjangoModelFactory):
     """
     Factory class for generating test Vendor instances with realistic data
@@ -46,88 +99,34 @@ class VendorFactory(factory.django.DjangoModelFactory):
         model = Vendor
         strategy = factory.CREATE_STRATEGY
 
+    class Params:
+        # Opt-in generators for fields most tests never read
+        with_caps = factory.Trait(
+            capabilities=factory.LazyFunction(_sample_capabilities)
+        )
+        with_profile = factory.Trait(
+            description=factory.LazyAttribute(
+                lambda obj: (
+                    f"{obj.name} is a leading provider of enterprise software solutions. "
+                    f"{faker.paragraph(nb_sentences=3)} "
+                    f"Our technology focuses on {faker.bs()}."
+                )
+            )
+        )
+
     # Basic vendor information with realistic patterns
     name = factory.LazyAttribute(lambda _: faker.company())
     website = factory.LazyAttribute(
         lambda obj: f"https://www.{obj.name.lower().replace(' ', '')}.com"
     )
-    description = factory.LazyAttribute(
-        lambda obj: (
-            f"{obj.name} is a leading provider of enterprise software solutions. "
-            f"{faker.paragraph(nb_sentences=3)} "
-            f"Our technology focuses on {faker.bs()}."
-        )
-    )
+    description = factory.LazyAttribute(lambda obj: f"{obj.name} test vendor.")
     
     # Default to pending status for new vendors
     status = PENDING
-    
-    # Initialize with default capabilities structure
-    capabilities = factory.LazyAttribute(
-        lambda _: {
-            "technologies": [
-                faker.random_element([
-                    "Python", "Java", "JavaScript", "React", "Node.js",
-                    "AWS", "Azure", "Docker", "Kubernetes"
-                ]) for _ in range(3)
-            ],
-            "industries": [
-                faker.random_element([
-                    "Technology", "Finance", "Healthcare", "Manufacturing",
-                    "Retail", "Education", "Government"
-                ]) for _ in range(2)
-            ],
-            "company_size": [
-                faker.random_element([
-                    "1-50", "51-200", "201-1000", "1001-5000", "5000+"
-                ]) for _ in range(2)
-            ],
-            "features": [
-                faker.random_element([
-                    "API Integration", "Single Sign-On", "Custom Reporting",
-                    "Mobile Support", "Data Analytics", "Workflow Automation"
-                ]) for _ in range(4)
-            ],
-            "pricing_tiers": [
-                {
-                    "name": tier,
-                    "price": f"${faker.random_int(min=100, max=1000)}/month",
-                    "features": [faker.bs() for _ in range(3)]
-                } for tier in ["Basic", "Professional", "Enterprise"]
-            ],
-            "implementation_time": faker.random_element([
-                "1-2 weeks", "2-4 weeks", "1-2 months", "3+ months"
-            ])
-        }
-    )
 
     # Set security classification for vendor data
     data_classification = DataClassification.SENSITIVE.value
 
-    @factory.post_generation
-    def setup_metadata(obj, create, extracted, **kwargs):
-        """
-        Post-generation hook to set up vendor metadata.
-        
-        Args:
-            create (bool): Whether to create a new instance
-            extracted: Extracted values from factory declaration
-            **kwargs: Additional keyword arguments
-        """
-        if not create:
-            return
-
-        obj.metadata = {
-            "status_history": [{
-                "from": None,
-                "to": obj.status,
-                "timestamp": obj.created_at.isoformat()
-            }],
-            "verification_history": [],
-            "capabilities_history": []
-        }
-        obj.save()
-
     @classmethod
     def _create(cls, model_class, *args, **kwargs):
         """
@@ -141,23 +140,65 @@ class VendorFactory(factory.django.DjangoModelFactory):
         Returns:
             Vendor: Created vendor instance
         """
-        # Ensure unique name generation
-        while True:
+        # Retry duplicate names with a random suffix, a bounded number of times
+        for attempt in range(MAX_CREATE_ATTEMPTS):
             try:
-                return super()._create(model_class, *args, **kwargs)
-            except Exception:  # Retry on duplicate name
-                kwargs['name'] = factory.LazyAttribute(lambda _: faker.company())
+                with transaction.atomic():
+                    return super()._create(model_class, *args, **kwargs)
+            except IntegrityError:
+                if attempt == MAX_CREATE_ATTEMPTS - 1:
+                    raise
+                kwargs['name'], kwargs['website'] = _unique_identity()
+
+    @classmethod
+    def create_bulk(cls, size, **kwargs):
+        """
+        Create multiple vendors with batched INSERTs.
+
+        Builds unsaved instances and inserts them, along with their initial
+        status history rows, with ``bulk_create``, bypassing per-instance
+        ``save()``. Names that repeat within the batch get a random suffix.
+
+        Args:
+            size (int): Number of vendors to create
+            **kwargs: Field overrides passed to ``build_batch``
+
+        Returns:
+            list[Vendor]: List of created vendor instances
+        """
+        vendors = cls.build_batch(size, **kwargs)
+        now = timezone.now()
+        seen_names = set()
+        for vendor in vendors:
+            if vendor.name.lower() in seen_names:
+                vendor.name, vendor.website = _unique_identity()
+            seen_names.add(vendor.name.lower())
+
+        with transaction.atomic():
+            vendors = Vendor.objects.bulk_create(
+                vendors, batch_size=BULK_CREATE_BATCH_SIZE
+            )
+            VendorStatusChange.objects.bulk_create(
+                [
+                    VendorStatusChange(
+                        vendor=vendor, to_status=vendor.status, changed_at=now
+                    )
+                    for vendor in vendors
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE
+            )
+        return vendors
 
     @classmethod
     def create_batch_with_status(cls, size, status):
         """
         Create multiple vendors with a specific status.
-        
+
         Args:
             size (int): Number of vendors to create
             status (str): Status to assign to vendors
-            
+
         Returns:
             list[Vendor]: List of created vendor instances
         """
-        return [cls(status=status) for _ in range(size)]
\ No newline at end of file
+        return cls.create_bulk(size, status=status)